@@ -29,12 +29,18 @@ html_static_path = ['_static']
 
 # Custom options
 
-extensions.append("myst_parser")
-extensions.append("sphinx.ext.autodoc")
-extensions.append("sphinx.ext.napoleon")
-extensions.append("sphinx_autodoc_typehints")
+import os
+import sys
+sys.path.insert(0, os.path.abspath('..'))  # can import massa_test_framework (autodoc)
+
+extensions.extend([
+    "myst_parser",
+    "sphinx.ext.autodoc",
+    "sphinx.ext.napoleon",
+    "sphinx_autodoc_typehints",
+])
 
-autodoc_mock_imports = [
+autodoc_mock_imports = sorted({
     "paramiko",
     "requests",
     "tomlkit",
@@ -45,8 +51,4 @@ autodoc_mock_imports = [
     "betterproto",
     "grpclib",
     "patch_ng"
-]
-
-import os
-import sys
-sys.path.insert(0, os.path.abspath('..'))  # can import massa_test_framework (autodoc)
+})
@@ -1,14 +1,90 @@
-from .server import Server, ServerOpts, MassaNodeOpts
-from .node import Node
-from .compile import CompileOpts, CompileUnit
-from .ledger_editor import LedgerEditor
+import importlib
+import os
+import threading
 
-# k8s manager
-# from .kubernetes_manager import KubernetesManager
+# Note: names are resolved on first access (PEP 562) so that importing the package does not
+#       pull in heavy dependencies (paramiko, grpclib, betterproto, blake3, ...) until needed
+_LAZY = {
+    "Server": ("massa_test_framework.server", "Server"),
+    "ServerOpts": ("massa_test_framework.server", "ServerOpts"),
+    "MassaNodeOpts": ("massa_test_framework.server", "MassaNodeOpts"),
+    "Node": ("massa_test_framework.node", "Node"),
+    "CompileOpts": ("massa_test_framework.compile", "CompileOpts"),
+    "CompileUnit": ("massa_test_framework.compile", "CompileUnit"),
+    "LedgerEditor": ("massa_test_framework.ledger_editor", "LedgerEditor"),
+    # k8s manager
+    # "KubernetesManager": ("massa_test_framework.k8s", "KubernetesManager"),
+    # data
+    "node_keys_list": ("massa_test_framework.misc", "node_keys_list"),
+    "NodeKeys": ("massa_test_framework.misc", "NodeKeys"),
+    # jsonrpc related
+    "create_roll_buy": ("massa_test_framework.massa_py", "create_roll_buy"),
+    "create_roll_sell": ("massa_test_framework.massa_py", "create_roll_sell"),
+    "create_transaction": ("massa_test_framework.massa_py", "create_transaction"),
+    "create_call_sc": ("massa_test_framework.massa_py", "create_call_sc"),
+    "create_execute_sc": ("massa_test_framework.massa_py", "create_execute_sc"),
+    "RollBuy": ("massa_test_framework.massa_py", "RollBuy"),
+    "RollSell": ("massa_test_framework.massa_py", "RollSell"),
+    "Transaction": ("massa_test_framework.massa_py", "Transaction"),
+    "CallSC": ("massa_test_framework.massa_py", "CallSC"),
+    "ExecuteSC": ("massa_test_framework.massa_py", "ExecuteSC"),
+    "Datastore": ("massa_test_framework.massa_py", "Datastore"),
+    "KeyPair": ("massa_test_framework.massa_py", "KeyPair"),
+    "decode_pubkey_to_bytes": (
+        "massa_test_framework.massa_py",
+        "decode_pubkey_to_bytes",
+    ),
+}
 
-# data
-from .misc import node_keys_list, NodeKeys
+__all__ = list(_LAZY.keys())
 
-# jsonrpc related
-from .massa_py import create_roll_buy, create_roll_sell, create_transaction, create_call_sc, create_execute_sc, RollBuy, RollSell, Transaction, CallSC, ExecuteSC, Datastore
-from .massa_py import KeyPair, decode_pubkey_to_bytes
\ No newline at end of file
+# Heavy dependencies imported in a background thread by preload
+_PRELOAD = ["paramiko", "grpclib.client", "betterproto", "blake3"]
+
+
+def _preload(modules: list[str]):
+    for modname in modules:
+        try:
+            importlib.import_module(modname)
+        except ImportError:
+            pass
+
+
+def preload() -> threading.Thread:
+    """Import heavy dependencies (paramiko, grpclib, betterproto, blake3) in a background thread
+
+    Call it early (e.g. before parsing arguments) so that they are (likely) already imported
+    when Server, Node... are first used. Setting env var MASSA_TF_PRELOAD=1 calls it on
+    package import.
+
+    Returns:
+        The (daemon) thread importing the dependencies
+    """
+    thread = threading.Thread(
+        target=_preload, args=(_PRELOAD,), name="preload", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+__all__.append("preload")
+
+# Note: opt-in, importing the package has no side effect by default
+if os.environ.get("MASSA_TF_PRELOAD", "") == "1":
+    preload()
+
+
+def __getattr__(name: str):
+    try:
+        modname, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    val = getattr(importlib.import_module(modname), attr)
+    # Cache it so next lookups do not go through __getattr__ anymore
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
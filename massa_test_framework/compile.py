@@ -1,14 +1,35 @@
+from contextlib import ExitStack
+import dataclasses
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
+from collections import deque
+import functools
+import hashlib
+import io
+import logging
+import os
 import re
-import copy
+import shlex
+import subprocess
+import sys
+import uuid
 
 from typing import Optional, List, Dict
 
 from massa_test_framework.server import Server
+from massa_test_framework.remote import RemotePath
 
-import patch_ng
+logger = logging.getLogger(__name__)
+
+# Compiled regex (per constant name) used by PatchConstant
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+DEFAULT_CONSTANT_FILE = Path("massa-models/src/config/constants.rs")
+# git clone options used for a shallow clone (see CompileOpts.shallow_clone)
+_SHALLOW_CLONE_OPTS = ["--depth=1", "--filter=blob:none", "--single-branch"]
+# Marker file written in a build cache folder once the build is successful
+_CACHE_DONE = ".done"
 
 
 @dataclass
@@ -23,20 +44,112 @@ class PatchConstant:
         # -->
         # pub const MIP_STORE_STATS_BLOCK_CONSIDERED: usize = 10;
 
-        print("f matching (.* const {self.constant_name}[ :].*) = (.*);")
         with open(root / self.constant_file, "r+") as fp:
             content = fp.read()
-            content_sub = re.sub(
-                f"(.* const {self.constant_name}[ :].*) = (.*);",
-                f"\g<1> = {self.new_value};",
-                content,
-            )
+            content_sub = self.apply_to_text(content)
             fp.seek(0)
             fp.truncate(0)
             fp.write(content_sub)
 
         return True
 
+    def apply_to_text(self, content: str) -> str:
+        """Return content with the constant value updated"""
+        pat = _PATTERN_CACHE.get(self.constant_name)
+        if pat is None:
+            pat = _PATTERN_CACHE[self.constant_name] = re.compile(
+                rf"(.* const {re.escape(self.constant_name)}[ :].*) = (.*);"
+            )
+        return pat.sub(rf"\g<1> = {self.new_value};", content)
+
+
+def _patch_to_bytes(patch: bytes | str | Path | PatchConstant) -> bytes:
+    """Patch content (used to compute the build cache key)"""
+    if isinstance(patch, Path):
+        return patch.read_bytes()
+    elif isinstance(patch, str):
+        return patch.encode()
+    elif isinstance(patch, bytes):
+        return patch
+    else:
+        return repr(patch).encode()
+
+
+# Note: patch_ng is only imported when needed (not used by the default patch backend)
+#       parsed patches are cached as the same patch is often applied to multiple compile units
+@functools.lru_cache(maxsize=128)
+def _parse_patch_file(path: str, mtime_ns: int):
+    import patch_ng
+
+    return patch_ng.fromfile(path)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_patch_data(data: bytes | str):
+    import patch_ng
+
+    return patch_ng.fromstring(data)
+
+
+def _group_patches(
+    patches: Dict[str, bytes | str | Path | PatchConstant]
+) -> List[Dict[Path, List[PatchConstant]] | tuple[int, str, bytes | str | Path]]:
+    """Group consecutive constant patches by file (so that every file is read & written once per
+    group), keeping the insertion order of the patches
+
+    Return:
+        A list of: {constant file: [constant patches]} or (patch index, patch name, patch)
+    """
+    groups: List[
+        Dict[Path, List[PatchConstant]] | tuple[int, str, bytes | str | Path]
+    ] = []
+    # Current group of constant patches (None if last patch is not a constant patch)
+    constants: Optional[Dict[Path, List[PatchConstant]]] = None
+    for patch_index, (patch_name, patch) in enumerate(patches.items()):
+        if isinstance(patch, PatchConstant):
+            if constants is None:
+                constants = {}
+                groups.append(constants)
+            constant_file = patch.constant_file or DEFAULT_CONSTANT_FILE
+            constants.setdefault(constant_file, []).append(patch)
+        else:
+            constants = None
+            groups.append((patch_index, patch_name, patch))
+    return groups
+
+
+class _TailOutput(io.TextIOBase):
+    """Forward output to sys.stdout and keep the last lines (e.g. for error messages)"""
+
+    def __init__(self, max_lines: int = 50):
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        self._partial = ""
+
+    def write(self, s: str) -> int:
+        sys.stdout.write(s)
+        *lines, self._partial = (self._partial + s).split("\n")
+        self.lines.extend(lines)
+        return len(s)
+
+    def tail(self) -> str:
+        return "\n".join([*self.lines, self._partial]).strip()
+
+
+# Note: built once, every CompileOpts get a copy
+_DEFAULT_CONFIG_FILES: Dict[str, Path] = {
+    "config.toml": Path("massa-node/base_config/config.toml"),
+    "initial_ledger.json": Path("massa-node/base_config/initial_ledger.json"),
+    "initial_peers.json": Path("massa-node/base_config/initial_peers.json"),
+    "initial_rolls.json": Path("massa-node/base_config/initial_rolls.json"),
+    # "initial_vesting.json": Path("massa-node/base_config/initial_vesting.json"),
+    "deferred_credits.json": Path("massa-node/base_config/deferred_credits.json"),
+    "bootstrap_whitelist.json": Path("massa-node/base_config/bootstrap_whitelist.json"),
+    "node_privkey.key": Path("massa-node/config/node_privkey.key"),
+    "abi_gas_costs.json": Path("massa-node/base_config/gas_costs/abi_gas_costs.json"),
+    "wasm_gas_costs.json": Path("massa-node/base_config/gas_costs/wasm_gas_costs.json"),
+    "client/config.toml": Path("massa-client/base_config/config.toml"),
+}
+
 
 class BuildKind(StrEnum):
     Debug = "debug"
@@ -49,33 +162,23 @@ class CompileOpts:
     git_url: Optional[str] = "https://github.com/massalabs/massa.git"
     # Clone (git clone) option
     clone_opts: List[str] = field(default_factory=list)
+    # If clone_opts select a branch (e.g. ["--branch", "main"]), clone only its last commit
+    # (only the working tree is needed to build)
+    # Note: any other ref (e.g. a tag or no --branch at all) is fully cloned so that any commit
+    #       can still be checked out
+    shallow_clone: bool = True
     # Build (Compile) option (e.g. for cargo build)
     build_opts: List[str] = field(default_factory=list)
     cargo_bin: str = "cargo"
     already_compiled: Optional[Path] = None
-    config_files: Dict[str, Path] = field(
-        default_factory=lambda: {
-            "config.toml": Path("massa-node/base_config/config.toml"),
-            "initial_ledger.json": Path("massa-node/base_config/initial_ledger.json"),
-            "initial_peers.json": Path("massa-node/base_config/initial_peers.json"),
-            "initial_rolls.json": Path("massa-node/base_config/initial_rolls.json"),
-            # "initial_vesting.json": Path("massa-node/base_config/initial_vesting.json"),
-            "deferred_credits.json": Path(
-                "massa-node/base_config/deferred_credits.json"
-            ),
-            "bootstrap_whitelist.json": Path(
-                "massa-node/base_config/bootstrap_whitelist.json"
-            ),
-            "node_privkey.key": Path("massa-node/config/node_privkey.key"),
-            "abi_gas_costs.json": Path(
-                "massa-node/base_config/gas_costs/abi_gas_costs.json"
-            ),
-            "wasm_gas_costs.json": Path(
-                "massa-node/base_config/gas_costs/wasm_gas_costs.json"
-            ),
-            "client/config.toml": Path("massa-client/base_config/config.toml"),
-        }
-    )
+    # Tool used to apply unified diff patches: "git" (git apply) or "patch_ng" (fuzzy apply)
+    patch_backend: str = "git"
+    # Run cargo fetch (download dependencies) while patches are applied
+    parallel_prefetch: bool = True
+    # If set, builds are done in (and reused from) this folder
+    # (keyed by git url, resolved commit, clone options, build command, patches & patch backend)
+    cache_dir: Optional[Path] = None
+    config_files: Dict[str, Path] = field(default_factory=_DEFAULT_CONFIG_FILES.copy)
 
 
 class CompileUnit:
@@ -91,6 +194,9 @@ class CompileUnit:
 
         self._repo = ""
         self._target = ""
+        # Computed on first access (and reset by compile)
+        self._build_kind: Optional[BuildKind] = None
+        self._bin_cache: Dict[str, Path] = {}
         self._patches: Dict[str, bytes | str | Path | PatchConstant] = {}
 
     @staticmethod
@@ -109,84 +215,314 @@ class CompileUnit:
             A new CompileUnit
         """
 
-        new_compile_opts = copy.copy(cu.compile_opts)
+        # Note: copy lists & dict so the 2 CompileOpts do not share them
+        new_compile_opts = dataclasses.replace(
+            cu.compile_opts,
+            clone_opts=list(cu.compile_opts.clone_opts),
+            build_opts=list(cu.compile_opts.build_opts),
+            config_files=dict(cu.compile_opts.config_files),
+        )
         if repo_sync:
-            new_compile_opts.git_url = cu.repo
+            new_compile_opts.git_url = str(cu.repo)
 
         return CompileUnit(server=cu.server, compile_opts=new_compile_opts)
 
     def compile(self) -> None:
         """Clone, apply patches if any then compile
 
+        If compile_opts.cache_dir is set and the same commit has already been built (with the same
+        build command and patches), the cached build is reused (no clone, no build)
+
         Raise:
             RuntimeError: if git clone return non 0, cargo build return non 0, patch cannot be applied
         """
-        tmp_folder = self.server.mkdtemp(prefix="compile_massa_")
+        build_cmd_ = [self.compile_opts.cargo_bin, "build"]
+        # print(self.compile_opts.build_opts)
+        build_cmd_.extend(self.compile_opts.build_opts)
+        build_cmd = " ".join(build_cmd_)
+
+        cache_folder = None
+        if self.compile_opts.cache_dir:
+            cache_key = self._cache_key(build_cmd)
+            if cache_key:
+                cache_folder = Path(self.compile_opts.cache_dir) / cache_key
+
+        if cache_folder is not None and self._cache_hit(cache_folder):
+            logger.info("Using cached build: %s", cache_folder)
+            tmp_folder: Path | RemotePath = cache_folder
+        else:
+            tmp_folder = self._clone_patch_build(build_cmd, cache_folder)
+
+        if "--target" in build_cmd:
+            # if --target is specified, path is like: target/{TARGET_NAME}/debug/[...]
+            rg_res = re.search(r"--target ([\w-]+)", build_cmd)
+            if not rg_res:
+                raise RuntimeError("Cannot match arch from --target")
+            self._repo = Path(tmp_folder)
+            self._target = rg_res.group(1)
+        else:
+            # No --target, path is like: target/debug/[...]
+            self._repo = Path(tmp_folder)
+            self._target = ""
+
+        self._build_kind = None
+        self._bin_cache.clear()
+
+    def _clone_patch_build(
+        self, build_cmd: str, folder: Optional[Path] = None
+    ) -> Path | RemotePath:
+        """Clone (in folder or in a new tmp folder), apply patches then build"""
+        if folder is None:
+            return self._clone_patch_build_in(
+                build_cmd, self.server.mkdtemp(prefix="compile_massa_")
+            )
+
+        # Note: build in a unique folder then rename it to folder (atomic), so that concurrent
+        #       builds with the same cache key never see (or write to) a partial build
+        self.server.mkdir(folder.parent)
+        tmp_folder = folder.parent / f"{folder.name}.tmp_{uuid.uuid4().hex}"
+        try:
+            self._clone_patch_build_in(build_cmd, tmp_folder)
+            with self.server.open(str(tmp_folder / _CACHE_DONE), "w"):
+                pass
+            try:
+                self.server.rename(tmp_folder, folder)
+            except OSError:
+                # Another build with the same cache key finished first, use it
+                if not self._cache_hit(folder):
+                    raise
+                self.server.fast_rmtree(tmp_folder)
+        except BaseException:
+            self.server.fast_rmtree(tmp_folder)
+            raise
+        return folder
+
+    def _clone_patch_build_in(
+        self, build_cmd: str, tmp_folder: Path | RemotePath
+    ) -> Path | RemotePath:
+        """Clone in tmp_folder, apply patches then build"""
         # print(self.compile_opts)
         # print(type(self.compile_opts))
         cmd = ["git", "clone"]
+        if (
+            self.server.server_opts.local
+            and Path(str(self.compile_opts.git_url)).exists()
+        ):
+            # Clone from a local folder (e.g. from_compile_unit with repo_sync): git can hardlink
+            # objects instead of copying them (--depth & --filter are ignored in this case)
+            cmd.append("--local")
+        elif self.compile_opts.shallow_clone:
+            ref = self._clone_ref()
+            if ref is not None and self._is_remote_branch(ref):
+                cmd.extend(_SHALLOW_CLONE_OPTS)
         cmd.extend(self.compile_opts.clone_opts)
         cmd.extend([str(self.compile_opts.git_url), str(tmp_folder)])
         print(f"Cloning repo, using cmd ${cmd=}...")
 
         # Note: need to join cmd otherwise it will fail
-        with self.server.run([" ".join(cmd)]) as proc:
-            proc.wait()
-            print("Done.")
+        returncode, output = self._run_logged(" ".join(cmd))
+        print("Done.")
 
-        # print("return code", proc.returncode)
-        if proc.returncode != 0:
+        # print("return code", returncode)
+        if returncode != 0:
             # TODO: custom exception like CloneError
             raise RuntimeError(
-                f"Could not clone {self.compile_opts.git_url} to {tmp_folder}, return code: {proc.returncode}"
+                f"Could not clone {self.compile_opts.git_url} to {tmp_folder}, return code: {returncode}\n"
+                f"{output}"
             )
 
-        # TODO: cleanup if apply fails?
-        for patch_name, patch in self._patches.items():
-            print(f"Applying patch {patch_name}")
+        with ExitStack() as fetch_stack:
+            fetch_proc = None
+            if self.compile_opts.parallel_prefetch:
+                fetch_cmd = f"{self.compile_opts.cargo_bin} fetch"
+                print("Fetch cmd:", fetch_cmd)
+                fetch_proc = fetch_stack.enter_context(
+                    self.server.run([fetch_cmd], cwd=str(tmp_folder))
+                )
+
+            def finish_fetch(proc):
+                proc.wait()
+                # Note: exit the context first (remote processes set their return code on exit)
+                fetch_stack.close()
+                if proc.returncode != 0:
+                    # Not fatal: cargo build will fetch (and report errors) anyway
+                    print(f"cargo fetch failed, return code: {proc.returncode}")
+
+            # TODO: cleanup if apply fails?
+            for group in _group_patches(self._patches):
+                if isinstance(group, dict):
+                    self._apply_patch_constants(tmp_folder, group)
+                    continue
+
+                # Note: unified diff patches can update Cargo.toml or Cargo.lock so wait for
+                #       cargo fetch to finish before applying them
+                if fetch_proc is not None:
+                    finish_fetch(fetch_proc)
+                    fetch_proc = None
+                self._apply_patch(tmp_folder, *group)
+
+            if fetch_proc is not None:
+                finish_fetch(fetch_proc)
+
+        print("Build cmd:", build_cmd)
+        # Note: no progress bar so output is line oriented
+        build_env = {"CARGO_TERM_PROGRESS_WHEN": "never"}
+        if self.server.server_opts.local:
+            # local env replace the whole environment (e.g. PATH)
+            build_env = {**os.environ, **build_env}
+        returncode, output = self._run_logged(
+            build_cmd, cwd=str(tmp_folder), env=build_env
+        )
+        print("Done.")
+
+        # print("return code", returncode)
+        if returncode != 0:
+            # TODO: custom exception like CompilationError?
+            raise RuntimeError(f"Could not build, return code: {returncode}\n{output}")
+
+        return tmp_folder
+
+    @staticmethod
+    def _apply_patch_constants(
+        tmp_folder: Path | RemotePath,
+        constants_by_file: Dict[Path, List[PatchConstant]],
+    ) -> None:
+        for constant_file, patch_constants in constants_by_file.items():
+            print(
+                f"Applying patches {[pc.constant_name for pc in patch_constants]} to {constant_file}"
+            )
+            constant_path = Path(tmp_folder) / constant_file
+            content = constant_path.read_text()
+            for patch_constant in patch_constants:
+                content = patch_constant.apply_to_text(content)
+            constant_path.write_text(content)
+            print("Done.")
+
+    def _apply_patch(
+        self,
+        tmp_folder: Path | RemotePath,
+        patch_index: int,
+        patch_name: str,
+        patch: bytes | str | Path,
+    ) -> None:
+        print(f"Applying patch {patch_name}")
+        if self.compile_opts.patch_backend == "patch_ng":
             if isinstance(patch, Path):
-                patchset = patch_ng.fromfile(patch)
-            elif isinstance(patch, str):
-                patchset = patch_ng.fromstring(patch)
+                patchset = _parse_patch_file(str(patch), patch.stat().st_mtime_ns)
             else:
-                patchset = patch  # PatchConstant
+                patchset = _parse_patch_data(patch)
 
             if isinstance(patchset, bool) and not patchset:
                 # patch_ng.fromfile or .fromstring return False on parse error
                 raise RuntimeError("Could not parse patch:", patch)
 
             res = patchset.apply(root=tmp_folder, fuzz=True)
-            if not res:
-                raise RuntimeError(
-                    f"Could not apply patch {patch_name} ({patch!r}) to repo: {tmp_folder}"
-                )
-            print("Done.")
-
-        build_cmd_ = [self.compile_opts.cargo_bin, "build"]
-        # print(self.compile_opts.build_opts)
-        build_cmd_.extend(self.compile_opts.build_opts)
-        build_cmd = " ".join(build_cmd_)
-        print("Build cmd:", build_cmd)
-        with self.server.run([build_cmd], cwd=str(tmp_folder)) as proc:
-            proc.wait()
-            print("Done.")
+        else:
+            # Write patch in .git folder (so it does not end up in the working tree)
+            patch_file = Path(tmp_folder) / ".git" / f"tf_patch_{patch_index}.diff"
+            with self.server.open(str(patch_file), "wb") as fp:
+                fp.write(_patch_to_bytes(patch))
+            git_apply_cmd = (
+                f"git apply --whitespace=nowarn {shlex.quote(str(patch_file))}"
+            )
+            returncode, output = self._run_logged(git_apply_cmd, cwd=str(tmp_folder))
+            res = returncode == 0
 
-        # print("return code", proc.returncode)
-        if proc.returncode != 0:
-            # TODO: custom exception like CompilationError?
-            raise RuntimeError("Could not build")
+        if not res:
+            raise RuntimeError(
+                f"Could not apply patch {patch_name} ({patch!r}) to repo: {tmp_folder}"
+            )
+        print("Done.")
 
-        if "--target" in build_cmd:
-            # if --target is specified, path is like: target/{TARGET_NAME}/debug/[...]
-            rg_res = re.search("--target ([\w-]+)", build_cmd)
-            if not rg_res:
-                raise RuntimeError("Cannot match arch from --target")
-            self._repo = Path(tmp_folder)
-            self._target = rg_res.group(1)
+    def _run_logged(
+        self,
+        cmd: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> tuple[int, str]:
+        """Run a command, forward its output to stdout and return (return code, last output lines)"""
+        output = _TailOutput()
+        if self.server.server_opts.local:
+            with self.server.run(
+                [cmd],
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            ) as proc:
+                for line in io.TextIOWrapper(proc.stdout, errors="replace"):
+                    output.write(line)
         else:
-            # No --target, path is like: target/debug/[...]
-            self._repo = Path(tmp_folder)
-            self._target = ""
+            with self.server.run([cmd], cwd=cwd, env=env, stdout=output) as proc:
+                proc.wait()
+        return proc.returncode, output.tail()
+
+    def _run_output(self, cmd: str, cwd: Optional[str] = None) -> tuple[int, str]:
+        """Run a (short) command and return (return code, output)"""
+        if self.server.server_opts.local:
+            with self.server.run([cmd], cwd=cwd, stdout=subprocess.PIPE) as proc:
+                out, _ = proc.communicate()
+            return proc.returncode, out.decode()
+        else:
+            buf = io.BytesIO()
+            with self.server.run([cmd], cwd=cwd, stdout=buf) as proc:
+                proc.wait()
+            return proc.returncode, buf.getvalue().decode()
+
+    def _clone_ref(self) -> Optional[str]:
+        """Ref (branch or tag) selected by clone_opts (--branch) or None"""
+        clone_opts = " ".join(self.compile_opts.clone_opts)
+        rg_res = re.search(r"(?:--branch[= ]|-b )(\S+)", clone_opts)
+        return rg_res.group(1) if rg_res else None
+
+    def _is_remote_branch(self, ref: str) -> bool:
+        git_url = str(self.compile_opts.git_url)
+        returncode, output = self._run_output(
+            f"git ls-remote --heads {shlex.quote(git_url)} {shlex.quote(ref)}"
+        )
+        return returncode == 0 and bool(output.split())
+
+    def _cache_key(self, build_cmd: str) -> Optional[str]:
+        """Build cache key or None if the commit to build cannot be resolved"""
+        git_url = str(self.compile_opts.git_url)
+        ref = self._clone_ref() or "HEAD"
+
+        returncode, output = self._run_output(
+            f"git ls-remote {shlex.quote(git_url)} {shlex.quote(ref)}"
+        )
+        if returncode != 0 or not output.split():
+            logger.warning(
+                "Could not resolve %s for %s, not using build cache", ref, git_url
+            )
+            return None
+        commit = output.split()[0]
+
+        # Note: every option that can change the build output is part of the key (e.g. clone
+        #       options like --recurse-submodules, or a shallow clone for a build reading the
+        #       git history)
+        h = hashlib.sha256()
+        for item in (
+            git_url,
+            commit,
+            " ".join(self.compile_opts.clone_opts),
+            str(self.compile_opts.shallow_clone),
+            build_cmd,
+            self.compile_opts.patch_backend,
+        ):
+            h.update(item.encode())
+            h.update(b"\0")
+        for patch_name, patch in self._patches.items():
+            h.update(patch_name.encode())
+            h.update(_patch_to_bytes(patch))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _cache_hit(self, folder: Path) -> bool:
+        try:
+            with self.server.open(str(folder / _CACHE_DONE), "r"):
+                return True
+        except OSError:
+            return False
 
     def add_patch(self, patch_name: str, patch: bytes | Path | PatchConstant) -> None:
         """Add patch to apply after cloning
@@ -206,7 +542,7 @@ class CompileUnit:
         constant_name: str,
         new_value: str,
         constant_type: Optional[str] = None,
-        constant_file: Optional[Path] = Path("massa-models/src/config/constants.rs"),
+        constant_file: Optional[Path] = DEFAULT_CONSTANT_FILE,
     ):
         """Add a patch updating a constant value in a rust file
 
@@ -229,17 +565,23 @@ class CompileUnit:
 
     @property
     def build_kind(self) -> BuildKind:
-        if "--release" in self.compile_opts.build_opts:
-            return BuildKind.Release
-        else:
-            return BuildKind.Debug
+        if self._build_kind is None:
+            if "--release" in self.compile_opts.build_opts:
+                self._build_kind = BuildKind.Release
+            else:
+                self._build_kind = BuildKind.Debug
+        return self._build_kind
 
-    def bin_path(self, bin_name: str):
+    def bin_path(self, bin_name: str) -> Path:
         """Relative path (relative to compilation folder) to (rust compiled) binary"""
-        if self._target:
-            return Path(f"target/{self._target}/{self.build_kind}/{bin_name}")
-        else:
-            return Path(f"target/{self.build_kind}/{bin_name}")
+        bin_path = self._bin_cache.get(bin_name)
+        if bin_path is None:
+            if self._target:
+                bin_path = Path(f"target/{self._target}/{self.build_kind}/{bin_name}")
+            else:
+                bin_path = Path(f"target/{self.build_kind}/{bin_name}")
+            self._bin_cache[bin_name] = bin_path
+        return bin_path
 
     @property
     def massa_node(self) -> Path:
@@ -1 +1,7 @@
+import logging
+
 from .massa_cluster_manager import MassaClusterManager, MassaClusterConfig, LaunchInfo
+
+# Note: library logging, silent unless the application configures logging (for instance with a
+#       logging.handlers.QueueHandler so that worker threads never block on output)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
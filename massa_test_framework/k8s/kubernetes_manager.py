@@ -6,8 +6,10 @@ It offers a convenient way to interact with Kubernetes clusters and perform comm
 
 Classes:
     KubernetesManager: A class for managing Kubernetes resources in a cluster.
+    AsyncKubernetesManager: Asyncio front-end of KubernetesManager.
     PodConfig: Configuration for a Kubernetes Pod.
     ServiceConfig: Configuration for a Kubernetes Service.
+    ServiceInfo / ServicePortsInfo: Information about a Kubernetes Service and its ports.
     ServicePortConfig: Configuration for a Kubernetes Service Port.
 
 Dependencies:
@@ -32,7 +34,7 @@ Example:
         opened_ports = [22, 33034, 33035, 33036, 33037, 33038, 31244, 31245]
         prefix = "m"
         suffix = "p"
-        external_i_ps = [""10.4.3.2""]
+        external_i_ps = ["10.4.3.2"]
         docker_image = "aoudiamoncef/ubuntu-sshd"  # Specify your Docker image
         ssh_authorized_keys = "ssh-ed25519 XXX_MY_SSH_KEY_XXX simulator@massa.net"
         env_variables = {
@@ -73,48 +75,95 @@ Example:
         node_3_service_config = ServiceConfig(namespace, node_3_pod_config, 
         "massa-node-3-service", external_i_ps, node_3_service_ports_config)
 
-        # Start services with the specified Docker image and authorized keys
-        manager.create_pod(node_1_pod_config)
-        manager.create_pod(node_2_pod_config)
-        manager.create_pod(node_3_pod_config)
+        # Start the pods concurrently with the specified Docker image and authorized keys
+        manager.create_pods([node_1_pod_config, node_2_pod_config, node_3_pod_config])
 
-        # Wait for a moment to allow services to start
-        time.sleep(3)
+        # Wait for the pods to be running (returns as soon as they all are)
+        manager.wait_for_pods_running(
+            namespace, ["massa-node-1-pod", "massa-node-2-pod", "massa-node-3-pod"]
+        )
 
-        # Get the informations of the pods
-        pods_info = manager.get_pods_info(namespace)
-        print("Available Pods:")    
-        print(pods_info)
+        # Iterate over the informations of the pods (fetched by pages, not kept in a list)
+        print("Available Pods:")
+        for pod_info in manager.iter_pods_info(namespace):
+            print(pod_info)
    
         # Create NodePort services with specified node ports
-        manager.create_service(node_1_service_config)
-        manager.create_service(node_2_service_config)
-        manager.create_service(node_3_service_config)
-
-        # Wait for a moment to allow services to start
-        time.sleep(3)
+        manager.create_services(
+            [node_1_service_config, node_2_service_config, node_3_service_config]
+        )
 
-        # Get the informations of the services
-        services_info = manager.get_services_info(namespace)
-        print("Available Services:")    
-        print(services_info)
+        # Wait for the services to be ready
+        manager.wait_for_services_ready(
+            namespace, ["massa-node-1-service", "massa-node-2-service", "massa-node-3-service"]
+        )
 
-        # Wait for a moment before removing the namespace
-        time.sleep(60)
+        # Iterate over the informations of the services
+        print("Available Services:")
+        for service_info in manager.iter_services_info(namespace):
+            print(service_info)
 
         print("Removing namespace...")
         # Remove the namespace
         manager.remove_namespace(namespace)
+        manager.wait_for_namespace_deleted(namespace)
 """
 
+from __future__ import annotations
+
+import array
+import asyncio
 import base64
-from dataclasses import dataclass
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import functools
+import importlib
+import json
+import logging
+import operator
 import os
-from typing import Optional
-from kubernetes import client, config as kube_config
+import threading
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence, TypeVar
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class _LazyModule:
+    """
+    Import a module on first attribute access
+    """
 
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
 
-@dataclass
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# Note: the kubernetes package imports thousands of generated model classes (hundreds of ms),
+#       only pay for it when the k8s api is actually used (and not e.g. to build a PodConfig)
+if TYPE_CHECKING:
+    from kubernetes import client, config as kube_config
+
+    # Note: kubernetes-stubs does not cover kubernetes.watch
+    from kubernetes import watch  # type: ignore[attr-defined]
+else:
+    client = _LazyModule("kubernetes.client")
+    kube_config = _LazyModule("kubernetes.config")
+    watch = _LazyModule("kubernetes.watch")
+
+
+@dataclass(slots=True)
 class PodPortConfig:
     """
     Configuration for Kubernetes Pod Port which is a configuration element
@@ -130,7 +179,20 @@ class PodPortConfig:
     container_port: int
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _v1_container_ports(
+    ports: tuple[tuple[str, int], ...]
+) -> tuple[client.V1ContainerPort, ...]:
+    # Note: pods usually open the same ports, share the (read only) objects between them.
+    #       Keyed by (name, container port) values as configs are mutable (so not hashable).
+    #       Labels are not cached: they contain the pod name, so differ for every pod
+    return tuple(
+        client.V1ContainerPort(name=name, container_port=container_port)
+        for name, container_port in ports
+    )
+
+
+@dataclass(slots=True)
 class PodConfig:
     """Configuration for a Kubernetes Pod.
 
@@ -139,19 +201,30 @@ class PodConfig:
         container_name (str): The name of the container within the pod.
         docker_image (str): The Docker image to be used for the container.
         name (str): The name of the pod.
-        opened_ports (list[PodPortConfig]): A list of ports to be opened in the container.
-        env_variables (list): Envirement variables to be added to the pod's environment.
+        opened_ports (Sequence[PodPortConfig]): Ports to be opened in the container.
+        env_variables (Sequence): Envirement variables to be added to the pod's environment.
+        labels (dict[str, str]): Extra labels of the pod (in addition to app=name), e.g. to
+            select all the pods of a cluster at once.
     """
 
     namespace: str
     container_name: str
     docker_image: str
     name: str
-    opened_ports: list[PodPortConfig]
-    env_variables: list
+    opened_ports: Sequence[PodPortConfig]
+    env_variables: Sequence
+    labels: dict[str, str] = field(default_factory=dict)
+
+    def v1_container_ports(self) -> list[client.V1ContainerPort]:
+        # Note: built from the current opened_ports (the config can be modified)
+        return list(
+            _v1_container_ports(
+                tuple((port.name, port.container_port) for port in self.opened_ports)
+            )
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePortConfig:
     """
     Configuration for Kubernetes Service Port which is a configuration element
@@ -172,7 +245,7 @@ class ServicePortConfig:
     node_port: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """
     Configuration for a Kubernetes Service.
@@ -181,18 +254,31 @@ class ServiceConfig:
         namespace (str): The namespace in which the service will be created.
         pod_config (PodConfig): The PodConfig object associated with this service.
         name (str): The name of the service.
-        external_i_ps (list[str]): List of external IP addresses for the service.
-        service_ports (list of ServicePortConfig): List of ServicePortConfig objects.
+        external_i_ps (Sequence[str]): External IP addresses for the service.
+        service_ports (Sequence of ServicePortConfig): ServicePortConfig objects.
+        labels (dict[str, str]): Labels of the service.
     """
 
     namespace: str
     pod_config: PodConfig
     name: str
-    external_i_ps: list[str]
-    service_ports: list[ServicePortConfig]
+    external_i_ps: Sequence[str]
+    service_ports: Sequence[ServicePortConfig]
+    labels: dict[str, str] = field(default_factory=dict)
+
+    def v1_service_ports(self) -> list[client.V1ServicePort]:
+        return [
+            client.V1ServicePort(
+                name=port_config.name,
+                port=port_config.port,
+                target_port=port_config.target_port,
+                node_port=port_config.node_port,
+            )
+            for port_config in self.service_ports
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployConfig:
     """
     Configuration for deploying a Kubernetes service and associated pod.
@@ -208,7 +294,7 @@ class DeployConfig:
     service_config: ServiceConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContainerPortInfo:
     """
     Represents information about a container port.
@@ -224,7 +310,7 @@ class ContainerPortInfo:
     protocol: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PodInfo:
     """
     Represents information about a Kubernetes pod.
@@ -232,20 +318,20 @@ class PodInfo:
     Attributes:
         name (str): The name of the pod.
         namespace (str): The namespace in which the pod is located.
-        status (str): The status of the pod (e.g., "Running", "Pending", etc.).
+        status (str, optional): The status of the pod (e.g., "Running", "Pending", etc.).
         pod_i_ps (list[str]): The IP(s) address of the pod.
-        container_ports (list[ContainerPortInfo]): A list of ContainerPortInfo objects representing
+        container_ports (tuple[ContainerPortInfo]): ContainerPortInfo objects representing
             the container ports of the pod.
     """
 
     name: str
     namespace: str
-    status: str
-    pod_ip: str
-    container_ports: list[ContainerPortInfo]
+    status: Optional[str]
+    pod_ip: Optional[str]
+    container_ports: tuple[ContainerPortInfo, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortInfo:
     """
     Data class representing information about a service port.
@@ -263,7 +349,27 @@ class PortInfo:
     node_port: int
 
 
-@dataclass
+@dataclass(slots=True)
+class ServicePortsInfo:
+    """
+    Ports of a Kubernetes service stored column by column (one sequence per PortInfo
+    attribute), for bulk processing of the port numbers (see
+    KubernetesManager.iter_services_ports_info).
+
+    Attributes:
+        names (tuple[str]): The port names.
+        ports (array[int]): The port numbers.
+        target_ports (tuple[int | str]): The target ports (numbers or container port names).
+        node_ports (array[int]): The node port numbers (0 if not allocated).
+    """
+
+    names: tuple[str, ...]
+    ports: array.array
+    target_ports: tuple[int | str, ...]
+    node_ports: array.array
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceInfo:
     """
     Data class representing information about a Kubernetes service.
@@ -271,16 +377,214 @@ class ServiceInfo:
     Attributes:
         name (str): The name of the service.
         namespace (str): The namespace in which the service is located.
-        cluster_i_ps (list[str]): A list of cluster IP addresses associated with the service.
-        external_i_ps (list[str]): A list of external IP addresses associated with the service.
-        ports (list[PortInfo]): A list of PortInfo instances representing service ports.
+        cluster_i_ps (tuple[str]): Cluster IP addresses associated with the service.
+        external_i_ps (tuple[str]): External IP addresses associated with the service.
+        ports (tuple[PortInfo]): PortInfo instances representing service ports.
     """
 
     name: str
     namespace: str
-    cluster_i_ps: list[str]
-    external_i_ps: list[str]
-    ports: list[PortInfo]
+    cluster_i_ps: tuple[str, ...]
+    external_i_ps: tuple[str, ...]
+    ports: tuple[PortInfo, ...]
+
+
+# Note: fetch all the needed attributes of a port in a single call, in the same order as the
+#       fields of ContainerPortInfo / PortInfo
+_container_port_fields = operator.attrgetter("name", "container_port", "protocol")
+_service_port_fields = operator.attrgetter("name", "port", "target_port", "node_port")
+
+_PARTIAL_METADATA_LIST = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+)
+_PARTIAL_METADATA = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1"
+
+# Note: number of objects per list request, bounds the size of each response while keeping
+#       the number of round trips low for big namespaces
+_PAGE_SIZE = 500
+
+
+@functools.lru_cache(maxsize=256)
+def _port_name(prefix: str, port: int, suffix: str) -> str:
+    # Note: pod and service ports share the same naming scheme. Cached: the same names are
+    #       built for the pod and the service of every node
+    return f"{prefix}-{port}-{suffix}"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_configuration(
+    config_file: Optional[str], mtime: Optional[int]
+) -> client.configuration.Configuration:
+    # Note: mtime is only part of the cache key, so the file is parsed again if modified.
+    #       Callers must not modify the returned object (copy it first)
+    configuration = client.configuration.Configuration()
+    if config_file:
+        kube_config.load_kube_config(config_file, client_configuration=configuration)
+    else:
+        kube_config.load_incluster_config(client_configuration=configuration)
+    return configuration
+
+
+# (config file, mtime, pool_maxsize, retries) -> [api client, number of managers using it]
+# Note: building an ApiClient (and opening its connections) is costly, so
+#       managers created with the same arguments in a process share the same one
+_shared_api_clients: dict[tuple, list] = {}
+_shared_api_clients_lock = threading.Lock()
+
+
+def _new_api_client(
+    config_file: Optional[str], mtime: Optional[int], pool_maxsize: int, retries: int
+) -> Any:
+    # Note: api client & configuration typed as Any, kubernetes-stubs lag behind the client
+    #       (e.g. no ApiClient.call_api or Configuration.retries)
+    configuration: Any = copy.deepcopy(_load_configuration(config_file, mtime))
+    configuration.connection_pool_maxsize = pool_maxsize
+    # Note: the api server answers 429 when its rate limit is reached (e.g. when
+    #       creating a lot of pods concurrently), retry instead of failing (after the
+    #       Retry-After delay if any). All methods are retried (urllib3 skips POST by
+    #       default, i.e. every create) since a 429 / 503 request was not processed, but
+    #       read errors are not (read=0): the request may have been processed
+    configuration.retries = urllib3.Retry(
+        total=retries,
+        read=0,
+        backoff_factor=0.1,
+        status_forcelist=[429, 503],
+        allowed_methods=None,
+        respect_retry_after_header=True,
+    )
+    api_client: Any = client.api_client.ApiClient(configuration)
+    # Note: the api server compresses large responses (e.g. lists of a big namespace) when
+    #       allowed to, urllib3 transparently decompresses them
+    api_client.set_default_header("Accept-Encoding", "gzip")
+    return api_client
+
+
+def _warm_up(api_client: Any):
+    # Open a first connection (and do the TLS handshake) with a cheap request, so that it is
+    # not paid by the first real call.
+    # Note: sent directly through the pool (without retries); any answer (even 401) opens the
+    #       connection
+    try:
+        resp = api_client.rest_client.pool_manager.request(
+            "GET",
+            f"{api_client.configuration.host}/version",
+            retries=False,
+            timeout=5,
+            preload_content=False,
+        )
+        resp.release_conn()
+    except Exception as e:
+        # Note: not an error here, the api server may not be reachable yet
+        logger.debug("Could not warm up the connection to the api server: %s", e)
+
+
+def _acquire_api_client(key: tuple) -> Any:
+    with _shared_api_clients_lock:
+        entry = _shared_api_clients.get(key)
+        if entry is None:
+            entry = [_new_api_client(*key), 0]
+            _shared_api_clients[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_api_client(key: tuple):
+    # Note: the api client is closed when the last manager using it is closed
+    with _shared_api_clients_lock:
+        entry = _shared_api_clients[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _shared_api_clients[key]
+            entry[0].close()
+
+
+def _raise_errors(errors: list, message: str):
+    # Note: a single error is raised as is, several ones are grouped so none is lost
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise ExceptionGroup(message, errors)
+
+
+class _Informer:
+    """
+    Local replica of the objects (pods or services) of a namespace: the objects are listed
+    once then kept up to date by a watch running in a background thread. The objects are
+    listed again every resync_period seconds to recover from missed events.
+    """
+
+    def __init__(
+        self, list_func, namespace: str, on_event=None, resync_period: int = 60
+    ):
+        self.namespace = namespace
+        self.resync_period = resync_period
+        # object name -> object (replaced, never modified in place, so readers can iterate)
+        self.objects: dict[str, Any] = {}
+        self.synced = threading.Event()
+        self._list_func = list_func
+        self._on_event = on_event
+        self._stopped = False
+        self._watch: Optional[watch.Watch] = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{namespace}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _notify(self, event_type: str, obj):
+        if self._on_event is not None:
+            self._on_event(event_type, obj)
+
+    def _run(self):
+        while not self._stopped:
+            try:
+                resource_version = self._relist()
+                self._watch = watch.Watch()
+                # Note: the api server ends the watch after resync_period, the loop then lists
+                #       the objects again (reconciliation) and starts a new watch
+                for event in self._watch.stream(
+                    self._list_func,
+                    self.namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self.resync_period,
+                ):
+                    obj = event["object"]
+                    objects = dict(self.objects)
+                    if event["type"] == "DELETED":
+                        objects.pop(obj.metadata.name, None)
+                    else:
+                        objects[obj.metadata.name] = obj
+                    self.objects = objects
+                    self._notify(event["type"], obj)
+            except client.exceptions.ApiException as e:
+                # 410 Gone: the resource version is too old, list again
+                if e.status != 410:
+                    logger.warning(
+                        "Informer of namespace %s error: %s", self.namespace, e
+                    )
+                    time.sleep(1)
+            except Exception:
+                logger.exception("Informer of namespace %s error", self.namespace)
+                time.sleep(1)
+
+    def _relist(self) -> str:
+        resp = self._list_func(
+            self.namespace, resource_version="0", resource_version_match="NotOlderThan"
+        )
+        objects = {obj.metadata.name: obj for obj in resp.items}
+        previous, self.objects = self.objects, objects
+        for name, obj in previous.items():
+            if name not in objects:
+                self._notify("DELETED", obj)
+        for obj in objects.values():
+            self._notify("ADDED", obj)
+        self.synced.set()
+        resource_version: str = resp.metadata.resource_version
+        return resource_version
 
 
 class KubernetesManager:
@@ -289,18 +593,92 @@ class KubernetesManager:
     """
 
     # Load Kubernetes configuration
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(
+        self,
+        config_file: Optional[str] = None,
+        cache_ttl: float = 5.0,
+        pool_maxsize: int = 50,
+        retries: int = 5,
+        warm_up: bool = False,
+    ):
         """
         Initialize a KubernetesManager object.
 
         Args:
             config_file (str, optional): Path to a Kubernetes configuration file.
             If None, in-cluster config is used.
+            cache_ttl (float): How long (in seconds) get_pods_info, get_services_info and
+            get_namespace_status results are cached (0 to disable the cache).
+            pool_maxsize (int): Maximum number of connections kept alive to the api server
+            (the concurrent methods never use more than pool_maxsize threads, minus one per
+            running informer, so max_workers arguments above it have no effect).
+            retries (int): Number of retries (with backoff) when the api server is
+            throttling (HTTP 429) or unavailable (HTTP 503).
+            warm_up (bool): Open a first connection to the api server (GET /version, up to
+            5 seconds, failures are ignored) so that it is not paid by the first call.
         """
         if config_file:
-            kube_config.load_kube_config(config_file)
+            # Note: absolute path so that relative and absolute paths to the same file
+            #       share the same cache entry
+            config_file = os.path.abspath(config_file)
+            mtime = os.stat(config_file).st_mtime_ns
         else:
-            kube_config.load_incluster_config()
+            mtime = None
+
+        # Note: a single ApiClient (and so a single urllib3 pool) is shared by all methods (and
+        #       by the managers created with the same arguments) so that connections are kept
+        #       alive between calls
+        self.pool_maxsize = pool_maxsize
+        self._api_client_key: Optional[tuple] = (
+            config_file,
+            mtime,
+            pool_maxsize,
+            retries,
+        )
+        self.api_client = _acquire_api_client(self._api_client_key)
+        # Note: not done in _acquire_api_client, which holds a lock shared by all managers
+        if warm_up:
+            _warm_up(self.api_client)
+        self.api = client.CoreV1Api(self.api_client)
+        self.apps_api = client.AppsV1Api(self.api_client)
+
+        # Pods waiting to be created by create_queued_pods
+        self._pod_queue: deque[PodConfig] = deque()
+
+        # (kind, namespace, *args) -> (expiration time, value), see _cached
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        # Note: the cache is used from the worker threads of the concurrent methods
+        self._cache_lock = threading.Lock()
+
+        # (namespace, pod name) -> event set while the pod is running, see wait_until_ready
+        self._ready_events: dict[tuple[str, str], threading.Event] = {}
+        # (kind, namespace) -> informer, see start_informer
+        self._informers: dict[tuple[str, str], _Informer] = {}
+        # namespace -> number of wait_until_ready calls using the pod informer they started
+        self._ready_waiters: dict[str, int] = {}
+        # Note: reentrant, wait_until_ready calls start_informer with the lock held
+        self._informers_lock = threading.RLock()
+        # (kind, namespace) -> (informer objects, infos converted from them), see _informer_infos
+        # Note: guarded by _cache_lock, used by the callers of get_*_info and by stop_informer
+        self._informer_infos_cache: dict[tuple[str, str], tuple[dict, list]] = {}
+
+    def close(self):
+        """
+        Stop the informers and release the connections to the api server.
+        """
+        for _, namespace in list(self._informers):
+            self.stop_informer(namespace)
+        # Note: close can be called several times
+        if self._api_client_key is not None:
+            _release_api_client(self._api_client_key)
+            self._api_client_key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     # Function to create a namespace
     def create_namespace(self, namespace: str):
@@ -310,11 +688,19 @@ class KubernetesManager:
         Args:
             namespace (str): The name of the namespace to create.
         """
-        api_instance = client.CoreV1Api()
-
         body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
 
-        api_instance.create_namespace(body)
+        # Note: create directly (instead of checking first) and accept an 'AlreadyExists' error,
+        #       this is a single request in both cases
+        try:
+            self.api.create_namespace(body)
+        except client.exceptions.ApiException as e:
+            if e.status == 409:
+                logger.debug("Namespace %s already exists", namespace)
+            else:
+                raise
+        finally:
+            self.invalidate_cache(namespace)
 
     # Function that creates envirement variables
     def create_env_variables(self, env_vars_map: dict):
@@ -328,21 +714,28 @@ class KubernetesManager:
         Returns:
             list: A list of Kubernetes environment variable objects.
         """
-        env_vars = []
-        for name, value in env_vars_map.items():
-            env_var = client.V1EnvVar(name=name)
-            if isinstance(value, list):
+        # Note: bind classes to locals, avoiding attribute lookups in the comprehension
+        V1EnvVar = client.V1EnvVar
+        V1EnvVarSource = client.V1EnvVarSource
+        V1ConfigMapKeySelector = client.V1ConfigMapKeySelector
+
+        return [
+            (
                 # Handle list values with a ConfigMapKeySelector
-                env_var.value_from = client.V1EnvVarSource(
-                    config_map_key_ref=client.V1ConfigMapKeySelector(
-                        name=name,  # Use the same name for ConfigMap and key
-                        key=name,
-                    )
+                V1EnvVar(
+                    name=name,
+                    value_from=V1EnvVarSource(
+                        config_map_key_ref=V1ConfigMapKeySelector(
+                            name=name,  # Use the same name for ConfigMap and key
+                            key=name,
+                        )
+                    ),
                 )
-            else:
-                env_var.value = str(value)
-            env_vars.append(env_var)
-        return env_vars
+                if isinstance(value, list)
+                else V1EnvVar(name=name, value=str(value))
+            )
+            for name, value in env_vars_map.items()
+        ]
 
     # Function to start a set of services with a specified Docker image and authorized keys
     def create_pod(self, pods_config: PodConfig):
@@ -352,31 +745,70 @@ class KubernetesManager:
         Args:
             pods_config (PodConfig): The PodConfig object containing pod configuration.
         """
-        api_instance = client.CoreV1Api()
-
-        container_ports = [
-            client.V1ContainerPort(
-                name=port_config.name, container_port=port_config.container_port
-            )
-            for port_config in pods_config.opened_ports
-        ]
+        self.api.create_namespaced_pod(
+            pods_config.namespace, self._build_pod(pods_config)
+        )
+        logger.debug("Pod %s created", pods_config.name)
+        self.invalidate_cache(pods_config.namespace)
+
+    @staticmethod
+    def _build_pod(pods_config: PodConfig) -> client.V1Pod:
+        return client.V1Pod(
+            api_version="v1",
+            kind="Pod",
+            metadata=client.V1ObjectMeta(
+                name=pods_config.name,
+                namespace=pods_config.namespace,
+                labels={**pods_config.labels, "app": pods_config.name},
+            ),
+            spec=KubernetesManager._build_pod_spec(pods_config),
+        )
 
+    @staticmethod
+    def _build_pod_spec(pods_config: PodConfig) -> client.V1PodSpec:
         container = client.V1Container(
             name=pods_config.name,
             image=pods_config.docker_image,
             image_pull_policy="Always",
-            ports=container_ports,
-            env=pods_config.env_variables,
+            ports=pods_config.v1_container_ports(),
+            env=list(pods_config.env_variables),
         )
+        return client.V1PodSpec(containers=[container])
+
+    # Function to create a deployment of identical pods
+    def create_deployment(self, pods_config: PodConfig, replicas: int):
+        """
+        Create a Kubernetes deployment running replicas identical pods, in a single request
+        (the pods are then created by the cluster).
 
-        pod = client.V1Pod(
+        The pods are labelled like the ones of create_pod, so a ServiceConfig built from
+        pods_config selects all of them.
+
+        Args:
+            pods_config (PodConfig): The PodConfig object used as pod template.
+            replicas (int): The number of pods to run.
+        """
+        labels = {"app": pods_config.name}
+        deployment = client.V1Deployment(
+            api_version="apps/v1",
+            kind="Deployment",
             metadata=client.V1ObjectMeta(
-                name=pods_config.name, labels={"app": pods_config.name}
+                name=pods_config.name, namespace=pods_config.namespace
+            ),
+            spec=client.V1DeploymentSpec(
+                replicas=replicas,
+                selector=client.V1LabelSelector(match_labels=labels),
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(
+                        labels={**pods_config.labels, **labels}
+                    ),
+                    spec=self._build_pod_spec(pods_config),
+                ),
             ),
-            spec=client.V1PodSpec(containers=[container]),
         )
-
-        api_instance.create_namespaced_pod(pods_config.namespace, pod)
+        self.apps_api.create_namespaced_deployment(pods_config.namespace, deployment)
+        logger.debug("Deployment %s created", pods_config.name)
+        self.invalidate_cache(pods_config.namespace)
 
     # Function to create a service from external access
     def create_service(self, config: ServiceConfig):
@@ -386,56 +818,168 @@ class KubernetesManager:
         Args:
             config (ServiceConfig): The ServiceConfig object containing service configuration.
         """
-        api_instance = client.CoreV1Api()
-        ports = []
-        for port_config in config.service_ports:
-            service_port = client.V1ServicePort(
-                name=port_config.name,
-                port=port_config.port,
-                target_port=port_config.target_port,
-                node_port=port_config.node_port,
-            )
-            ports.append(service_port)
-
-        service = client.V1Service(
-            metadata=client.V1ObjectMeta(name=config.name),
+        self.api.create_namespaced_service(
+            config.namespace, self._build_service(config)
+        )
+        logger.debug("Service %s created", config.name)
+        self.invalidate_cache(config.namespace)
+
+    @staticmethod
+    def _build_service(config: ServiceConfig) -> client.V1Service:
+        return client.V1Service(
+            api_version="v1",
+            kind="Service",
+            metadata=client.V1ObjectMeta(
+                name=config.name,
+                namespace=config.namespace,
+                labels=config.labels or None,
+            ),
             spec=client.V1ServiceSpec(
                 type="NodePort",
                 selector={"app": config.pod_config.name},
-                ports=ports,
-                external_i_ps=config.external_i_ps,
+                ports=config.v1_service_ports(),
+                external_i_ps=list(config.external_i_ps),
             ),
         )
 
-        api_instance.create_namespaced_service(config.namespace, service)
+    # Function to create a set of pods concurrently
+    def create_pods(self, pods_configs: list[PodConfig], max_workers: int = 16):
+        """
+        Create several Kubernetes pods concurrently.
+
+        Args:
+            pods_configs (list[PodConfig]): The PodConfig objects of the pods to create.
+            max_workers (int): Maximum number of concurrent requests to the api server.
+
+        Raise:
+            the error raised by a pod creation, or an ExceptionGroup if several failed
+        """
+        self._pod_queue.extend(pods_configs)
+        self.create_queued_pods(max_workers)
+
+    def enqueue_pod(self, pods_config: PodConfig):
+        """
+        Add a pod to the queue of pods to create (see create_queued_pods).
+
+        Args:
+            pods_config (PodConfig): The PodConfig object containing pod configuration.
+        """
+        self._pod_queue.append(pods_config)
+
+    def create_queued_pods(self, max_workers: int = 16):
+        """
+        Create all the pods in the queue, using up to max_workers threads.
+
+        Args:
+            max_workers (int): Maximum number of concurrent requests to the api server.
+
+        Raise:
+            the error raised by a pod creation, or an ExceptionGroup if several failed
+            (once every worker has finished)
+        """
+        errors: list[Exception] = []
+        workers = [
+            threading.Thread(target=self._create_pod_from_queue, args=(errors,))
+            for _ in range(self._max_workers(max_workers, len(self._pod_queue)))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        _raise_errors(errors, "Cannot create pods")
+
+    def _create_pod_from_queue(self, errors: list[Exception]):
+        # Note: deque append / popleft are thread safe so workers can drain it concurrently
+        while True:
+            try:
+                pods_config = self._pod_queue.popleft()
+            except IndexError:
+                return
+
+            try:
+                self.create_pod(pods_config)
+            except Exception as e:
+                errors.append(e)
+
+    # Function to create a set of services concurrently
+    def create_services(self, configs: list[ServiceConfig], max_workers: int = 16):
+        """
+        Create several Kubernetes services concurrently.
+
+        Args:
+            configs (list[ServiceConfig]): The ServiceConfig objects of the services to create.
+            max_workers (int): Maximum number of concurrent requests to the api server.
+
+        Raise:
+            the error raised by a service creation, or an ExceptionGroup if several failed
+        """
+        self._run_concurrently(self.create_service, configs, max_workers)
+
+    def _max_workers(self, max_workers: int, items_count: int) -> int:
+        # Note: more threads than pooled connections would not run more requests concurrently,
+        #       they would open extra connections discarded by urllib3 ("Connection pool is full").
+        #       Each running informer keeps a pooled connection busy with its watch
+        available = self.pool_maxsize - len(self._informers)
+        return max(1, min(max_workers, available, items_count))
+
+    def _run_concurrently(self, func, items: list, max_workers: int):
+        # Note: CoreV1Api is thread safe and calls are network bound, so a thread pool is enough
+        if len(items) <= 1:
+            for item in items:
+                func(item)
+            return
+
+        max_workers = self._max_workers(max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            errors = [
+                error
+                for future in as_completed(futures)
+                if (error := future.exception()) is not None
+            ]
+
+        _raise_errors(errors, f"{len(errors)}/{len(items)} requests failed")
 
     # Function to create a secret
     def create_secret(self, namespace: str, secret_name: str, data: dict):
-        # Create a Kubernetes client
-        api_client = client.CoreV1Api()
-
-        # Base64 encode the data
-        encoded_data = {
-            key: base64.b64encode(value.encode("utf-8")).decode("utf-8")
-            for key, value in data.items()
-        }
+        # Note: text values are sent as stringData (the api server does the base64 encoding),
+        #       only binary values need to be encoded here
+        b64encode = base64.b64encode
+        string_data = {}
+        encoded_data = {}
+        # Note: a single pass over data, each value is checked once
+        for key, value in data.items():
+            if isinstance(value, str):
+                string_data[key] = value
+            else:
+                encoded_data[key] = b64encode(value).decode("ascii")
 
         # Create the Secret object
         secret = client.V1Secret(
             metadata=client.V1ObjectMeta(name=secret_name),
             type="Opaque",
-            data=encoded_data,
+            string_data=string_data or None,
+            data=encoded_data or None,
         )
 
-        # Create the Secret in Kubernetes@
-        api_client.create_namespaced_secret(namespace=namespace, body=secret)
+        # Create the Secret in Kubernetes
+        # Note: as for create_namespace, an 'AlreadyExists' error is accepted (e.g. launching a
+        #       cluster again after remove_nodes), the secret is then updated with data
+        try:
+            self.api.create_namespaced_secret(namespace=namespace, body=secret)
+        except client.exceptions.ApiException as e:
+            if e.status != 409:
+                raise
+            logger.debug("Secret %s already exists, replacing it", secret_name)
+            self.api.replace_namespaced_secret(
+                name=secret_name, namespace=namespace, body=secret
+            )
 
     def create_secret_env_variables(self, secret_name, secret_data_map):
-        # Create a list to store environment variables
-        env_variables = []
-        # Iterate through the secret_data_map and create V1EnvVar objects
-        for env_name, _ in secret_data_map.items():
-            env_var = client.V1EnvVar(
+        # One environment variable (referencing the key in the secret) per secret entry
+        return [
+            client.V1EnvVar(
                 name=env_name,
                 value_from=client.V1EnvVarSource(
                     secret_key_ref=client.V1SecretKeySelector(
@@ -444,13 +988,8 @@ class KubernetesManager:
                     )
                 ),
             )
-            env_variables.append(env_var)
-
-        # Set the environment variables in the current process
-        for env_var in env_variables:
-            os.environ[env_var.name] = env_var.value_from.secret_key_ref.key
-
-        return env_variables
+            for env_name in secret_data_map
+        ]
 
     # Create a set of pod port configurations
     def create_pod_port_configs(
@@ -469,7 +1008,7 @@ class KubernetesManager:
             list[PodPortConfig]: A list of PodPortConfig instances.
         """
         pod_port_configs = [
-            PodPortConfig(name=f"{prefix}-{port}-{suffix}", container_port=port)
+            PodPortConfig(name=_port_name(prefix, port, suffix), container_port=port)
             for port in opened_ports
         ]
 
@@ -491,150 +1030,928 @@ class KubernetesManager:
         Returns:
             list[ServicePortConfig]: A list of ServicePortConfig instances.
         """
-        num_ports_per_node = len(opened_ports)
-        service_ports_config = []
+        base = node_index * len(opened_ports)
 
-        for port_index, port in enumerate(opened_ports, start=1):
-            service_port_config = ServicePortConfig(
-                f"{prefix}-{port}-{suffix}",
-                20000 + (node_index * num_ports_per_node) + port_index,
+        return [
+            ServicePortConfig(
+                _port_name(prefix, port, suffix),
+                20000 + base + port_index,
                 port,
-                30000 + (node_index * num_ports_per_node) + port_index,
+                30000 + base + port_index,
             )
-            service_ports_config.append(service_port_config)
-
-        return service_ports_config
+            for port_index, port in enumerate(opened_ports, start=1)
+        ]
 
     # Function to get the informations of pods
-    def get_pods_info(self, namespace: str) -> list[PodInfo]:
+    def get_pods_info(
+        self,
+        namespace: str,
+        fresh: bool = False,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        pod_names: Optional[list[str]] = None,
+    ) -> list[PodInfo]:
         """
         Get information about pods in a Kubernetes namespace.
 
         Args:
             namespace (str): The namespace to query.
+            fresh (bool): if True, bypass the cache and do a consistent read (by default, the
+            api server answers from its watch cache which can be slightly stale).
+            label_selector (str, optional): only return pods matching this label selector
+            (e.g. "app=massa-node-1-pod").
+            field_selector (str, optional): only return pods matching this field selector
+            (e.g. "status.phase=Running").
+            pod_names (list[str], optional): only return the pods with these names (pods
+            created by create_pod).
 
         Returns:
             list: A list of PodInfo objects containing pod information.
         """
-        api_instance = client.CoreV1Api()
-        pods_info = []
-
-        # List Pods in the specified namespace
-        pods = api_instance.list_namespaced_pod(namespace)
-
-        for pod in pods.items:
-            container_ports = []
-            # Extract and add the container ports to the container_ports list
-            for container in pod.spec.containers:
-                for port in container.ports:
-                    container_port_info = ContainerPortInfo(
-                        name=port.name,
-                        container_port=port.container_port,
-                        protocol=port.protocol,
-                    )
-                    container_ports.append(container_port_info)
-
-            # Create a PodInfo object for the pod
-            pod_info = PodInfo(
-                name=pod.metadata.name,
-                namespace=namespace,
-                status=pod.status.phase,
-                pod_ip=pod.status.pod_ip,
-                container_ports=container_ports,
+        if pod_names:
+            # Note: a field selector accepts a single metadata.name, so select on the app label
+            #       set by create_pod instead (filtered by the api server)
+            names_selector = f"app in ({','.join(pod_names)})"
+            label_selector = (
+                f"{label_selector},{names_selector}"
+                if label_selector
+                else names_selector
             )
 
-            pods_info.append(pod_info)
+        if not fresh and label_selector is None and field_selector is None:
+            pods_info = self._informer_infos(
+                "pods", namespace, lambda pod: self._pod_to_info(pod, namespace)
+            )
+            if pods_info is not None:
+                return pods_info
+
+        return self._cached(
+            "pods",
+            namespace,
+            fresh,
+            functools.partial(
+                self._list_pods_info, resource_version=None if fresh else "0"
+            ),
+            label_selector,
+            field_selector,
+        )
 
-        return pods_info
+    def _list_pods_info(
+        self,
+        namespace: str,
+        label_selector: Optional[str],
+        field_selector: Optional[str],
+        resource_version: Optional[str],
+    ) -> list[PodInfo]:
+        return list(
+            self.iter_pods_info(
+                namespace,
+                label_selector,
+                field_selector,
+                resource_version=resource_version,
+            )
+        )
+
+    # Function to iterate over the informations of pods
+    def iter_pods_info(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        page_size: int = _PAGE_SIZE,
+        resource_version: Optional[str] = None,
+    ) -> Iterator[PodInfo]:
+        """
+        Iterate over the pods of a Kubernetes namespace, fetching them by pages
+        (not cached, see get_pods_info).
+
+        Args:
+            namespace (str): The namespace to query.
+            label_selector (str, optional): only return pods matching this label selector.
+            field_selector (str, optional): only return pods matching this field selector.
+            page_size (int): Maximum number of pods fetched per request.
+            resource_version (str, optional): "0" to be served from the api server watch cache
+            (faster but maybe stale), None for a consistent read.
+
+        Returns:
+            An iterator of PodInfo objects.
+        """
+        # Note: filtering is done by the api server so only the matching pods are sent back
+        for pod in self._iter_pages(
+            self.api.list_namespaced_pod,
+            namespace,
+            page_size,
+            resource_version,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        ):
+            yield self._pod_json_to_info(pod, namespace)
+
+    @staticmethod
+    def _pod_to_info(pod: client.V1Pod, namespace: str) -> PodInfo:
+        # Note: status can be None (e.g. pod just created, see _on_pod_event)
+        status = pod.status
+        return PodInfo(
+            name=pod.metadata.name,
+            namespace=namespace,
+            status=status.phase if status is not None else None,
+            pod_ip=status.pod_ip if status is not None else None,
+            container_ports=tuple(
+                ContainerPortInfo(*_container_port_fields(port))
+                for container in pod.spec.containers
+                for port in (container.ports or ())
+            ),
+        )
+
+    @staticmethod
+    def _pod_json_to_info(pod: dict, namespace: str) -> PodInfo:
+        # Note: same as _pod_to_info, from the raw json of a pod
+        status = pod.get("status", {})
+        return PodInfo(
+            name=pod["metadata"]["name"],
+            namespace=namespace,
+            status=status.get("phase"),
+            pod_ip=status.get("podIP"),
+            container_ports=tuple(
+                ContainerPortInfo(
+                    port.get("name"), port["containerPort"], port.get("protocol")
+                )
+                for container in pod["spec"]["containers"]
+                for port in container.get("ports", ())
+            ),
+        )
 
     # Function to get the informations of services
-    def get_services_info(self, namespace: str) -> list[ServiceInfo]:
+    def get_services_info(
+        self,
+        namespace: str,
+        fresh: bool = False,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> list[ServiceInfo]:
         """
         Get information about services in a Kubernetes namespace.
 
         Args:
             namespace (str): The namespace to query.
+            fresh (bool): if True, bypass the cache and do a consistent read (by default, the
+            api server answers from its watch cache which can be slightly stale).
+            label_selector (str, optional): only return services matching this label selector.
+            field_selector (str, optional): only return services matching this field selector
+            (e.g. "metadata.name=massa-node-1-service").
 
         Returns:
             list: A list of dictionaries containing service information.
         """
-        api_instance = client.CoreV1Api()
+        if not fresh and label_selector is None and field_selector is None:
+            services_info = self._informer_infos(
+                "services", namespace, self._service_to_info
+            )
+            if services_info is not None:
+                return services_info
+
+        return self._cached(
+            "services",
+            namespace,
+            fresh,
+            functools.partial(
+                self._list_services_info, resource_version=None if fresh else "0"
+            ),
+            label_selector,
+            field_selector,
+        )
+
+    def _list_services_info(
+        self,
+        namespace: str,
+        label_selector: Optional[str],
+        field_selector: Optional[str],
+        resource_version: Optional[str],
+    ) -> list[ServiceInfo]:
+        return list(
+            self.iter_services_info(
+                namespace,
+                label_selector,
+                field_selector,
+                resource_version=resource_version,
+            )
+        )
+
+    # Function to iterate over the informations of services
+    def iter_services_info(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        page_size: int = _PAGE_SIZE,
+        resource_version: Optional[str] = None,
+    ) -> Iterator[ServiceInfo]:
+        """
+        Iterate over the services of a Kubernetes namespace, fetching them by pages
+        (not cached, see get_services_info).
+
+        Args:
+            namespace (str): The namespace to query.
+            label_selector (str, optional): only return services matching this label selector.
+            field_selector (str, optional): only return services matching this field selector.
+            page_size (int): Maximum number of services fetched per request.
+            resource_version (str, optional): "0" to be served from the api server watch cache
+            (faster but maybe stale), None for a consistent read.
+
+        Returns:
+            An iterator of ServiceInfo objects.
+        """
+        for service in self._iter_pages(
+            self.api.list_namespaced_service,
+            namespace,
+            page_size,
+            resource_version,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        ):
+            yield self._service_json_to_info(service)
+
+    @staticmethod
+    def _service_to_info(service: client.V1Service) -> ServiceInfo:
+        return ServiceInfo(
+            name=service.metadata.name,
+            namespace=service.metadata.namespace,
+            cluster_i_ps=tuple(service.spec.cluster_i_ps or ()),
+            external_i_ps=tuple(service.spec.external_i_ps or ()),
+            ports=tuple(
+                PortInfo(*_service_port_fields(port))
+                for port in (service.spec.ports or ())
+            ),
+        )
+
+    @staticmethod
+    def _service_json_to_info(service: dict) -> ServiceInfo:
+        # Note: same as _service_to_info, from the raw json of a service
+        metadata = service["metadata"]
+        spec = service["spec"]
+        return ServiceInfo(
+            name=metadata["name"],
+            namespace=metadata["namespace"],
+            cluster_i_ps=tuple(spec.get("clusterIPs", ())),
+            external_i_ps=tuple(spec.get("externalIPs", ())),
+            ports=tuple(
+                PortInfo(
+                    port.get("name"),
+                    port["port"],
+                    port.get("targetPort"),
+                    port.get("nodePort"),
+                )
+                for port in spec.get("ports", ())
+            ),
+        )
+
+    # Function to iterate over the ports of services
+    def iter_services_ports_info(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        page_size: int = _PAGE_SIZE,
+        resource_version: Optional[str] = None,
+    ) -> Iterator[tuple[str, ServicePortsInfo]]:
+        """
+        Iterate over the ports of the services of a Kubernetes namespace, fetching them by
+        pages (not cached). Ports are read column by column from the raw service json, no
+        PortInfo object is created.
+
+        Args:
+            namespace (str): The namespace to query.
+            label_selector (str, optional): only return services matching this label selector.
+            field_selector (str, optional): only return services matching this field selector.
+            page_size (int): Maximum number of services fetched per request.
+            resource_version (str, optional): "0" to be served from the api server watch cache
+            (faster but maybe stale), None for a consistent read.
+
+        Returns:
+            An iterator of (service name, ServicePortsInfo) tuples.
+        """
+        for service in self._iter_pages(
+            self.api.list_namespaced_service,
+            namespace,
+            page_size,
+            resource_version,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        ):
+            yield service["metadata"]["name"], self._service_ports_json_to_info(
+                service["spec"].get("ports", ())
+            )
+
+    @staticmethod
+    def _service_ports_json_to_info(ports: list[dict]) -> ServicePortsInfo:
+        names: list[str] = []
+        numbers = array.array("i")
+        target_ports: list[int | str] = []
+        node_ports = array.array("i")
+        for port in ports:
+            # Note: name is optional for a single port service, target port defaults to port
+            names.append(port.get("name", ""))
+            numbers.append(port["port"])
+            target_ports.append(port.get("targetPort", port["port"]))
+            node_ports.append(port.get("nodePort", 0))
+        return ServicePortsInfo(tuple(names), numbers, tuple(target_ports), node_ports)
+
+    # Function to get the informations of both pods and services
+    def get_pods_and_services_info(
+        self,
+        namespace: str,
+        fresh: bool = False,
+        label_selector: Optional[str] = None,
+    ) -> tuple[list[PodInfo], list[ServiceInfo]]:
+        """
+        Get information about pods and services in a Kubernetes namespace, both lists being
+        fetched concurrently (one round trip instead of two).
+
+        Args:
+            namespace (str): The namespace to query.
+            fresh (bool): if True, bypass the cache and do consistent reads (see get_pods_info).
+            label_selector (str, optional): only return pods and services matching this label
+            selector.
+
+        Returns:
+            A tuple (list of PodInfo, list of ServiceInfo).
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            services_future = executor.submit(
+                self.get_services_info, namespace, fresh, label_selector
+            )
+            pods_info = self.get_pods_info(namespace, fresh, label_selector)
+            return pods_info, services_future.result()
+
+    @staticmethod
+    def _iter_pages(
+        list_func,
+        namespace: str,
+        page_size: int,
+        resource_version: Optional[str],
+        **kwargs,
+    ):
+        # Note: use limit / continue so that a page is received (and parsed) at a time,
+        #       bounding memory usage on large namespaces. Pages are parsed as raw json (dicts),
+        #       skipping the client models deserialization of fields that are never read
+        if resource_version is not None:
+            # Note: NotOlderThan lets the api server answer from its watch cache with any
+            #       version at least as recent as resource_version (no etcd quorum read)
+            kwargs["resource_version_match"] = "NotOlderThan"
+        resp = list_func(
+            namespace,
+            limit=page_size,
+            resource_version=resource_version,
+            _preload_content=False,
+            **kwargs,
+        )
+        kwargs.pop("resource_version_match", None)
+        page = json.loads(resp.data)
+        yield from page["items"]
+        continue_token = page["metadata"].get("continue")
+        while continue_token:
+            # Note: the continue token already pins the resource version of the first page
+            resp = list_func(
+                namespace,
+                limit=page_size,
+                _continue=continue_token,
+                _preload_content=False,
+                **kwargs,
+            )
+            page = json.loads(resp.data)
+            yield from page["items"]
+            continue_token = page["metadata"].get("continue")
+
+    # Function to get the names of pods
+    def get_pod_names(
+        self, namespace: str, label_selector: Optional[str] = None
+    ) -> list[str]:
+        """
+        Get the names of the pods in a Kubernetes namespace.
+
+        Only the metadata of the pods is transferred (not their spec and status), which is
+        much lighter than get_pods_info when only names are needed.
+
+        Args:
+            namespace (str): The namespace to query.
+            label_selector (str, optional): only return pods matching this label selector.
+
+        Returns:
+            list[str]: the names of the pods
+        """
+        return self._list_names("pods", namespace, label_selector)
+
+    # Function to get the names of services
+    def get_service_names(
+        self, namespace: str, label_selector: Optional[str] = None
+    ) -> list[str]:
+        """
+        Get the names of the services in a Kubernetes namespace (metadata only, see
+        get_pod_names).
+
+        Args:
+            namespace (str): The namespace to query.
+            label_selector (str, optional): only return services matching this label selector.
+
+        Returns:
+            list[str]: the names of the services
+        """
+        return self._list_names("services", namespace, label_selector)
+
+    def _list_names(
+        self, resource: str, namespace: str, label_selector: Optional[str]
+    ) -> list[str]:
+        query_params = [
+            ("resourceVersion", "0"),
+            ("resourceVersionMatch", "NotOlderThan"),
+        ]
+        if label_selector:
+            query_params.append(("labelSelector", label_selector))
+
+        # Note: ask the api server for a PartialObjectMetadataList (metadata only) and parse the
+        #       raw json, skipping the client models deserialization
+        resp = self.api_client.call_api(
+            f"/api/v1/namespaces/{{namespace}}/{resource}",
+            "GET",
+            path_params={"namespace": namespace},
+            query_params=query_params,
+            header_params={"Accept": _PARTIAL_METADATA_LIST},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False,
+        )
+        return [item["metadata"]["name"] for item in json.loads(resp.data)["items"]]
+
+    # Function to wait for pods to be running
+    def wait_for_pods_running(
+        self, namespace: str, names: list[str], timeout: int = 120
+    ):
+        """
+        Wait until all the given pods are in the Running phase with all their containers ready.
+
+        Args:
+            namespace (str): The namespace of the pods.
+            names (list[str]): The names of the pods to wait for.
+            timeout (int): Maximum time to wait for (in seconds).
+
+        Raise:
+            RuntimeError: if some pods are not running after timeout
+        """
+        self._wait_for(
+            self.api.list_namespaced_pod,
+            namespace,
+            names,
+            self._is_pod_ready,
+            timeout,
+        )
+
+    @staticmethod
+    def _is_pod_ready(pod: client.V1Pod) -> bool:
+        status = pod.status
+        if status is None or status.phase != "Running":
+            return False
+        # Note: Running only means that containers were started, not that they are ready
+        return all(cs.ready for cs in status.container_statuses or ())
+
+    # Function to wait for services to be ready
+    def wait_for_services_ready(
+        self, namespace: str, names: list[str], timeout: int = 120
+    ):
+        """
+        Wait until all the given services have been assigned a cluster IP.
+
+        Args:
+            namespace (str): The namespace of the services.
+            names (list[str]): The names of the services to wait for.
+            timeout (int): Maximum time to wait for (in seconds).
+
+        Raise:
+            RuntimeError: if some services are not ready after timeout
+        """
+        self._wait_for(
+            self.api.list_namespaced_service,
+            namespace,
+            names,
+            lambda service: service.spec is not None and bool(service.spec.cluster_ip),
+            timeout,
+        )
 
-        services_info = []
-        services = api_instance.list_namespaced_service(namespace)
+    @staticmethod
+    def _wait_for(list_func, namespace: str, names: list[str], is_ready, timeout: int):
+        # Note: the watch first sends an ADDED event for every existing object, then pushes
+        #       updates as they happen, so no polling is required
+        remaining = set(names)
+        if not remaining:
+            return
+
+        kwargs = {}
+        if len(remaining) == 1:
+            # Note: the api server only accepts a single metadata.name per field selector
+            (name,) = remaining
+            kwargs["field_selector"] = f"metadata.name={name}"
+
+        w = watch.Watch()
+        for event in w.stream(
+            list_func, namespace=namespace, timeout_seconds=timeout, **kwargs
+        ):
+            obj = event["object"]
+            if obj.metadata.name in remaining and is_ready(obj):
+                remaining.discard(obj.metadata.name)
+                if not remaining:
+                    w.stop()
+                    return
+
+        raise RuntimeError(
+            f"Timeout ({timeout}s) waiting for {', '.join(sorted(remaining))} in namespace {namespace}"
+        )
 
-        for service in services.items:
-            port_infos = []
+    # Function to wait for a namespace to be deleted
+    def wait_for_namespace_deleted(self, namespace: str, timeout: int = 120):
+        """
+        Wait until a namespace (e.g. removed with remove_namespace) no longer exists.
 
-            for port in service.spec.ports:
-                port_info = PortInfo(
-                    name=port.name,
-                    port=port.port,
-                    target_port=port.target_port,
-                    node_port=port.node_port,
+        Args:
+            namespace (str): The namespace to wait for.
+            timeout (int): Maximum time to wait for (in seconds).
+
+        Raise:
+            RuntimeError: if the namespace still exists after timeout
+        """
+        field_selector = f"metadata.name={namespace}"
+        resp = self.api.list_namespace(field_selector=field_selector)
+        if resp.items:
+            # Note: watch from the resource version of the list so that a deletion happening
+            #       in between is not missed
+            w = watch.Watch()
+            for event in w.stream(
+                self.api.list_namespace,
+                field_selector=field_selector,
+                resource_version=resp.metadata.resource_version
+                if resp.metadata
+                else None,
+                timeout_seconds=timeout,
+            ):
+                if event["type"] == "DELETED":
+                    w.stop()
+                    break
+            else:
+                raise RuntimeError(
+                    f"Timeout ({timeout}s) waiting for namespace {namespace} deletion"
                 )
-                port_infos.append(port_info)
-
-            service_info = ServiceInfo(
-                name=service.metadata.name,
-                namespace=service.metadata.namespace,
-                cluster_i_ps=service.spec.cluster_i_ps,
-                external_i_ps=service.spec.external_i_ps,
-                ports=port_infos,
+
+        self.invalidate_cache(namespace)
+
+    # Function to wait for a pod to be running
+    def wait_until_ready(
+        self, namespace: str, pod_name: str, timeout: float = 60
+    ) -> bool:
+        """
+        Wait until a pod is in the Running phase.
+
+        Pods of the namespace are followed by the pod informer of the namespace, so waiting
+        for many pods (concurrently) does not issue any extra request. If not already running
+        (see start_informer), the informer is started for the time of the wait(s) only.
+
+        Args:
+            namespace (str): The namespace of the pod.
+            pod_name (str): The name of the pod.
+            timeout (float): Maximum time to wait for (in seconds).
+
+        Returns:
+            True if the pod is running, False on timeout
+        """
+        key = (namespace, pod_name)
+        with self._informers_lock:
+            # Note: an informer started by the user (start_informer) is left running
+            owned = (
+                namespace in self._ready_waiters
+                or ("pods", namespace) not in self._informers
             )
+            if owned:
+                self._ready_waiters[namespace] = (
+                    self._ready_waiters.get(namespace, 0) + 1
+                )
+                self.start_informer(namespace, services=False)
 
-            services_info.append(service_info)
+        try:
+            return self._wait_ready_event(key, timeout)
+        finally:
+            if owned:
+                with self._informers_lock:
+                    self._ready_waiters[namespace] -= 1
+                    if not self._ready_waiters[namespace]:
+                        # Note: last waiter, so get_pods_info does not keep being served by
+                        #       an informer that nobody asked for
+                        del self._ready_waiters[namespace]
+                        self._stop_informer("pods", namespace)
+
+    def _wait_ready_event(self, key: tuple[str, str], timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            # Note: the event is looked up again on every iteration, a deleted (then
+            #       re-created) pod gets a new event
+            with self._informers_lock:
+                event = self._ready_events.setdefault(key, threading.Event())
+            remaining = deadline - time.monotonic()
+            if event.wait(max(0.0, min(remaining, 1.0))):
+                return True
+            if remaining <= 1.0:
+                break
+
+        # Note: drop the entry (unless the pod became ready meanwhile) so that waiting for
+        #       pods that never run does not grow _ready_events, the next event of the pod
+        #       adds it back
+        with self._informers_lock:
+            if key in self._ready_events and not self._ready_events[key].is_set():
+                del self._ready_events[key]
+        return False
+
+    def _on_pod_event(self, event_type: str, pod: client.V1Pod):
+        # Note: objects sent by the informer always have a name and a namespace
+        metadata: Any = pod.metadata
+        key = (metadata.namespace, metadata.name)
+        with self._informers_lock:
+            if event_type == "DELETED":
+                # Note: entries are only kept for existing pods
+                ready_event = self._ready_events.pop(key, None)
+                if ready_event is not None:
+                    ready_event.clear()
+                return
+            ready_event = self._ready_events.setdefault(key, threading.Event())
+        # Note: status can be None (e.g. ADDED event of a pod just created)
+        if pod.status is not None and pod.status.phase == "Running":
+            ready_event.set()
+        else:
+            ready_event.clear()
 
-        return services_info
+    # Function to keep a local replica of the pods / services of a namespace
+    def start_informer(self, namespace: str, pods: bool = True, services: bool = True):
+        """
+        Keep a local replica of the pods and / or services of a namespace, kept up to date
+        by a watch: get_pods_info / get_services_info (without selectors) then read it
+        instead of querying the api server.
+
+        Args:
+            namespace (str): The namespace to follow.
+            pods (bool): follow the pods of the namespace.
+            services (bool): follow the services of the namespace.
+        """
+        with self._informers_lock:
+            if pods and ("pods", namespace) not in self._informers:
+                self._informers[("pods", namespace)] = _Informer(
+                    self.api.list_namespaced_pod, namespace, self._on_pod_event
+                )
+            if services and ("services", namespace) not in self._informers:
+                self._informers[("services", namespace)] = _Informer(
+                    self.api.list_namespaced_service, namespace
+                )
+
+    def stop_informer(self, namespace: str):
+        """
+        Stop following the pods and services of a namespace (see start_informer).
+
+        Args:
+            namespace (str): The namespace to stop following.
+        """
+        with self._informers_lock:
+            for kind in ("pods", "services"):
+                self._stop_informer(kind, namespace)
+
+    def _stop_informer(self, kind: str, namespace: str):
+        # Note: called with _informers_lock held
+        with self._cache_lock:
+            informer = self._informers.pop((kind, namespace), None)
+            self._informer_infos_cache.pop((kind, namespace), None)
+        if informer is not None:
+            informer.stop()
+        if kind == "pods":
+            # Note: pods are not followed anymore, their ready events would get stale
+            for key in [key for key in self._ready_events if key[0] == namespace]:
+                del self._ready_events[key]
+
+    def _informer_infos(self, kind: str, namespace: str, to_info) -> Optional[list]:
+        informer = self._informers.get((kind, namespace))
+        if informer is None or not informer.synced.is_set():
+            return None
+
+        # Note: informer.objects is replaced (never modified in place) on every change, so the
+        #       infos converted from the same dict are still valid: objects are only converted
+        #       again after a change
+        objects = informer.objects
+        with self._cache_lock:
+            cached = self._informer_infos_cache.get((kind, namespace))
+        if cached is None or cached[0] is not objects:
+            cached = (objects, [to_info(objects[name]) for name in sorted(objects)])
+            with self._cache_lock:
+                # Note: not stored if the informer has been stopped meanwhile
+                if self._informers.get((kind, namespace)) is informer:
+                    self._informer_infos_cache[(kind, namespace)] = cached
+        return list(cached[1])
 
     # Function to get the status of a namespace
-    def get_namespace_status(self, namespace: str):
+    def get_namespace_status(self, namespace: str, fresh: bool = False):
         """
         Get the status of a Kubernetes namespace.
 
         Args:
             namespace_name (str): The name of the namespace to check.
+            fresh (bool): if True, bypass the cache and query the api server.
 
         Returns:
             str: The status of the namespace.
                 Returns None if the namespace does not exist.
         """
-        # Create an instance of the CoreV1Api
-        api_instance = client.CoreV1Api()
+        return self._cached("namespace", namespace, fresh, self._read_namespace_status)
 
+    def _read_namespace_status(self, namespace: str):
         try:
             # Attempt to read the namespace
-            namespace_info = api_instance.read_namespace(namespace)
+            namespace_info = self.api.read_namespace(namespace)
 
             # Get the phase/status of the namespace
             namespace_status = namespace_info.status
 
             return namespace_status
-        except client.rest.ApiException as e:
+        except client.exceptions.ApiException as e:
             if e.status == 404:
                 return None
             else:
                 raise
 
+    # Function to get the phase of a namespace
+    def get_namespace_phase(self, namespace: str) -> Optional[str]:
+        """
+        Get the phase of a Kubernetes namespace from its metadata only (lighter than
+        get_namespace_status, not cached: meant to be polled).
+
+        Args:
+            namespace (str): The name of the namespace to check.
+
+        Returns:
+            "Terminating" if the namespace is being deleted, "Active" otherwise.
+            None if the namespace does not exist.
+        """
+        try:
+            resp = self.api_client.call_api(
+                "/api/v1/namespaces/{name}",
+                "GET",
+                path_params={"name": namespace},
+                header_params={"Accept": _PARTIAL_METADATA},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+            )
+        except client.exceptions.ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+        # Note: a namespace is Terminating as soon as its deletion timestamp is set
+        metadata = json.loads(resp.data)["metadata"]
+        return "Terminating" if metadata.get("deletionTimestamp") else "Active"
+
+    def _cached(
+        self, kind: str, namespace: str, fresh: bool, fetch: Callable[..., _T], *args
+    ) -> _T:
+        if self.cache_ttl <= 0:
+            return fetch(namespace, *args)
+
+        key = (kind, namespace, *args)
+        now = time.monotonic()
+        if not fresh:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                cached_value: _T = entry[1]
+                return self._copy_cached(cached_value)
+
+        # Note: fetched without holding the lock (other threads can use the cache meanwhile)
+        value = fetch(namespace, *args)
+        with self._cache_lock:
+            # Note: each selector gets its own entry, drop the expired ones so that the cache
+            #       does not grow with the number of distinct queries
+            for k in list(self._cache):
+                if self._cache[k][0] <= now:
+                    del self._cache[k]
+            self._cache[key] = (now + self.cache_ttl, value)
+        return self._copy_cached(value)
+
+    @staticmethod
+    def _copy_cached(value: _T) -> _T:
+        # Note: return a copy (e.g. a new list) so that callers can modify it without altering
+        #       the cache (infos are frozen dataclasses so a shallow copy is enough)
+        return copy.copy(value)
+
+    def invalidate_cache(self, namespace: Optional[str] = None):
+        """
+        Drop cached pods / services / namespace information.
+
+        Args:
+            namespace (str, optional): only drop entries of this namespace.
+            If None, the whole cache is dropped.
+        """
+        with self._cache_lock:
+            if namespace is None:
+                self._cache.clear()
+            else:
+                for key in list(self._cache):
+                    if key[1] == namespace:
+                        del self._cache[key]
+
     # Function to remove a set of services
-    def remove_services(self, namespace: str, names: Optional[list[str]] = None):
+    def remove_services(
+        self,
+        namespace: str,
+        names: Optional[list[str]] = None,
+        max_workers: int = 16,
+        label_selector: Optional[str] = None,
+    ):
         """
         Remove services from a Kubernetes namespace.
 
         Args:
             namespace (str): The namespace from which to remove services.
-            names (list, optional): List of service names to remove.
-            If None, all services in the namespace are removed.
+            names (list, optional): List of service names to remove (services that do
+            not exist are ignored). If None, all services in the namespace are removed.
+            max_workers (int): Maximum number of concurrent requests to the api server.
+            label_selector (str, optional): when names is None, only remove services matching
+            this label selector (in a single request).
+        """
+        try:
+            if names:
+                self._run_concurrently(
+                    lambda name: self._delete_service(name, namespace),
+                    names,
+                    max_workers,
+                )
+            else:
+                # Note: a single request, services are deleted by the api server. Background
+                #       propagation: the call returns without waiting for dependents
+                # Note: kubernetes-stubs lag behind the client (method added in client 26)
+                self.api.delete_collection_namespaced_service(  # type: ignore[attr-defined]
+                    namespace,
+                    label_selector=label_selector,
+                    propagation_policy="Background",
+                )
+        finally:
+            self.invalidate_cache(namespace)
+
+    def _delete_service(self, name: str, namespace: str):
+        try:
+            self.api.delete_namespaced_service(name, namespace)
+        except client.exceptions.ApiException as e:
+            # Already removed: nothing to do (do not fail the whole removal for it)
+            if e.status != 404:
+                raise
+
+    # Function to remove a set of pods
+    def remove_pods(self, namespace: str, label_selector: Optional[str] = None):
         """
-        api_instance = client.CoreV1Api()
+        Remove pods from a Kubernetes namespace (in a single request).
 
-        if names:
-            for name in names:
-                api_instance.delete_namespaced_service(name, namespace)
-        else:
-            pods = api_instance.list_namespaced_service(namespace)
-            for pod in pods.items:
-                api_instance.delete_namespaced_service(pod.metadata.name, namespace)
+        Args:
+            namespace (str): The namespace from which to remove pods.
+            label_selector (str, optional): only remove pods matching this label selector
+            (e.g. "app=massa-node-1-pod"). If None, all pods in the namespace are removed.
+        """
+        try:
+            self.api.delete_collection_namespaced_pod(
+                namespace,
+                label_selector=label_selector,
+                propagation_policy="Background",
+            )
+        finally:
+            self.invalidate_cache(namespace)
+
+    # Function to remove the pods and services of a namespace
+    def remove_pods_and_services(
+        self, namespace: str, label_selector: Optional[str] = None
+    ):
+        """
+        Remove services and pods from a Kubernetes namespace, both collection deletions being
+        sent concurrently (two requests in total).
+
+        Args:
+            namespace (str): The namespace from which to remove pods and services.
+            label_selector (str, optional): only remove pods and services matching this label
+            selector. If None, all pods and services in the namespace are removed.
+
+        Raise:
+            the error raised by a deletion, or an ExceptionGroup if both failed
+        """
+        errors: list[BaseException] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            services_future = executor.submit(
+                self.remove_services, namespace, label_selector=label_selector
+            )
+            try:
+                self.remove_pods(namespace, label_selector)
+            except Exception as e:
+                errors.append(e)
+            if (error := services_future.exception()) is not None:
+                errors.append(error)
+
+        _raise_errors(errors, "Cannot remove pods and services")
 
     # Function to remove a namespace
     def remove_namespace(self, namespace: str):
@@ -644,7 +1961,156 @@ class KubernetesManager:
         Args:
             namespace (str): The namespace to remove.
         """
-        api_instance = client.CoreV1Api()
-        api_instance.delete_namespace(
-            namespace, body=client.V1DeleteOptions(propagation_policy="Foreground")
+        # Note: Background: the api server does not wait for the dependents to be finalized
+        #       before answering, and pods are not given a grace period (test teardown). Use
+        #       wait_for_namespace_deleted to wait for the actual deletion
+        self.api.delete_namespace(
+            namespace,
+            body=client.V1DeleteOptions(
+                propagation_policy="Background", grace_period_seconds=0
+            ),
         )
+        self.invalidate_cache(namespace)
+
+
+class AsyncKubernetesManager:
+    """
+    Asyncio front-end of KubernetesManager: every api server call is run in a worker thread
+    so that several calls can be awaited concurrently (e.g. with asyncio.gather).
+    """
+
+    def __init__(self, config_file: Optional[str] = None, **kwargs):
+        """
+        Initialize an AsyncKubernetesManager object.
+
+        Args:
+            config_file (str, optional): Path to a Kubernetes configuration file.
+            If None, in-cluster config is used.
+            kwargs: other KubernetesManager arguments
+        """
+        self.manager = KubernetesManager(config_file, **kwargs)
+
+    async def close(self):
+        """
+        Stop the informers and release the connections to the api server.
+        """
+        await asyncio.to_thread(self.manager.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def create_namespace(self, namespace: str):
+        await asyncio.to_thread(self.manager.create_namespace, namespace)
+
+    async def create_secret(self, namespace: str, secret_name: str, data: dict):
+        await asyncio.to_thread(
+            self.manager.create_secret, namespace, secret_name, data
+        )
+
+    async def create_pod(self, pods_config: PodConfig):
+        await asyncio.to_thread(self.manager.create_pod, pods_config)
+
+    async def create_pods(self, pods_configs: list[PodConfig], max_workers: int = 16):
+        await self._gather(self.create_pod, pods_configs, max_workers)
+
+    async def create_deployment(self, pods_config: PodConfig, replicas: int):
+        await asyncio.to_thread(self.manager.create_deployment, pods_config, replicas)
+
+    async def create_service(self, config: ServiceConfig):
+        await asyncio.to_thread(self.manager.create_service, config)
+
+    async def create_services(
+        self, configs: list[ServiceConfig], max_workers: int = 16
+    ):
+        await self._gather(self.create_service, configs, max_workers)
+
+    async def _gather(self, func, items: list, max_workers: int):
+        # Note: bound the number of requests in flight (as the sync manager does) and wait for
+        #       all of them before raising, so no request is left running in the background
+        semaphore = asyncio.Semaphore(
+            self.manager._max_workers(max_workers, len(items))
+        )
+
+        async def run(item):
+            async with semaphore:
+                await func(item)
+
+        results = await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        _raise_errors(errors, f"{len(errors)}/{len(items)} requests failed")
+
+    async def get_pods_info(self, namespace: str, **kwargs) -> list[PodInfo]:
+        return await asyncio.to_thread(self.manager.get_pods_info, namespace, **kwargs)
+
+    async def get_services_info(self, namespace: str, **kwargs) -> list[ServiceInfo]:
+        return await asyncio.to_thread(
+            self.manager.get_services_info, namespace, **kwargs
+        )
+
+    async def get_pods_and_services_info(
+        self,
+        namespace: str,
+        fresh: bool = False,
+        label_selector: Optional[str] = None,
+    ) -> tuple[list[PodInfo], list[ServiceInfo]]:
+        return await asyncio.to_thread(
+            self.manager.get_pods_and_services_info, namespace, fresh, label_selector
+        )
+
+    async def get_namespace_phase(self, namespace: str) -> Optional[str]:
+        return await asyncio.to_thread(self.manager.get_namespace_phase, namespace)
+
+    async def get_namespace_status(self, namespace: str, fresh: bool = False):
+        return await asyncio.to_thread(
+            self.manager.get_namespace_status, namespace, fresh
+        )
+
+    async def wait_for_pods_running(
+        self, namespace: str, names: list[str], timeout: int = 120
+    ):
+        await asyncio.to_thread(
+            self.manager.wait_for_pods_running, namespace, names, timeout
+        )
+
+    async def wait_for_services_ready(
+        self, namespace: str, names: list[str], timeout: int = 120
+    ):
+        await asyncio.to_thread(
+            self.manager.wait_for_services_ready, namespace, names, timeout
+        )
+
+    async def wait_for_namespace_deleted(self, namespace: str, timeout: int = 120):
+        await asyncio.to_thread(
+            self.manager.wait_for_namespace_deleted, namespace, timeout
+        )
+
+    async def remove_services(
+        self,
+        namespace: str,
+        names: Optional[list[str]] = None,
+        label_selector: Optional[str] = None,
+    ):
+        await asyncio.to_thread(
+            self.manager.remove_services,
+            namespace,
+            names,
+            label_selector=label_selector,
+        )
+
+    async def remove_pods(self, namespace: str, label_selector: Optional[str] = None):
+        await asyncio.to_thread(self.manager.remove_pods, namespace, label_selector)
+
+    async def remove_pods_and_services(
+        self, namespace: str, label_selector: Optional[str] = None
+    ):
+        await asyncio.to_thread(
+            self.manager.remove_pods_and_services, namespace, label_selector
+        )
+
+    async def remove_namespace(self, namespace: str):
+        await asyncio.to_thread(self.manager.remove_namespace, namespace)
@@ -61,8 +61,8 @@ Example:
         print(f"Namespace {cluster_config.namespace} terminated.")
 """
 
+import logging
 import os
-import time
 from typing import Optional
 
 from .kubernetes_manager import (
@@ -75,8 +75,13 @@ from .kubernetes_manager import (
 
 from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Label set on the pods and services of a cluster (value: the namespace of the cluster)
+CLUSTER_LABEL = "massa-cluster"
+
+
+@dataclass(slots=True)
 class MassaClusterConfig:
     """
     Data class representing configuration for a MassaCluster.
@@ -87,30 +92,60 @@ class MassaClusterConfig:
         external_i_ps (list[str]): A list of external IP addresses.
         ssh_authorized_keys (str): The authorized SSH keys.
         existing_secret (str): The name of an existing secret to use.
-        startup_pods_timeout (int): The timeout for pod startup (default is 3 seconds).
-        startup_services_timeout (int): The timeout for service startup (default is 3 seconds).
+        startup_pods_timeout (int): Maximum time to wait for the pods to be running
+            (default is 120 seconds).
+        startup_services_timeout (int): Maximum time to wait for the services to be ready
+            (default is 120 seconds).
     """
 
-    namespace: str = os.environ.get("MASSA_TEST_FRAMEWORK_NAMESPACE", "massa-simulator")
-    nodes_number: int = int(os.environ.get("MASSA_TEST_FRAMEWORK_NODES_NUMBER", "3"))
+    # Note: defaults are read from the environment when an instance is created (not when the
+    #       module is imported), so environment changes made after import are taken into account
+    namespace: str = field(
+        default_factory=lambda: os.environ.get(
+            "MASSA_TEST_FRAMEWORK_NAMESPACE", "massa-simulator"
+        )
+    )
+    nodes_number: int = field(
+        default_factory=lambda: int(
+            os.environ.get("MASSA_TEST_FRAMEWORK_NODES_NUMBER", "3")
+        )
+    )
     external_i_ps: list[str] = field(
+        default_factory=lambda: [
+            ip
+            for ip in os.environ.get("MASSA_TEST_FRAMEWORK_EXTERNAL_I_PS", "").split(
+                ","
+            )
+            if ip
+        ]
+    )
+    ssh_username: str = field(
         default_factory=lambda: os.environ.get(
-            "MASSA_TEST_FRAMEWORK_EXTERNAL_I_PS", ""
-        ).split(",")
+            "MASSA_TEST_FRAMEWORK_SSH_USERNAME", "simulator"
+        )
     )
-    ssh_username: str = os.environ.get("MASSA_TEST_FRAMEWORK_SSH_USERNAME", "simulator")
-    ssh_password: str = os.environ.get("MASSA_TEST_FRAMEWORK_SSH_PASSWORD", "")
-    ssh_authorized_keys: str = os.environ.get(
-        "MASSA_TEST_FRAMEWORK_SSH_AUTHORIZED_KEYS", ""
+    ssh_password: str = field(
+        default_factory=lambda: os.environ.get("MASSA_TEST_FRAMEWORK_SSH_PASSWORD", "")
     )
-    ssh_existing_secret: str = os.environ.get(
-        "MASSA_TEST_FRAMEWORK_SSH_EXISTING_SECRET", "massa-credentials"
+    ssh_authorized_keys: str = field(
+        default_factory=lambda: os.environ.get(
+            "MASSA_TEST_FRAMEWORK_SSH_AUTHORIZED_KEYS", ""
+        )
     )
-    startup_pods_timeout: int = int(
-        os.environ.get("MASSA_TEST_FRAMEWORK_STARTUP_PODS_TIMEOUT", "3")
+    ssh_existing_secret: str = field(
+        default_factory=lambda: os.environ.get(
+            "MASSA_TEST_FRAMEWORK_SSH_EXISTING_SECRET", "massa-credentials"
+        )
+    )
+    startup_pods_timeout: int = field(
+        default_factory=lambda: int(
+            os.environ.get("MASSA_TEST_FRAMEWORK_STARTUP_PODS_TIMEOUT", "120")
+        )
     )
-    startup_services_timeout: int = int(
-        os.environ.get("MASSA_TEST_FRAMEWORK_STARTUP_SERVICES_TIMEOUT", "3")
+    startup_services_timeout: int = field(
+        default_factory=lambda: int(
+            os.environ.get("MASSA_TEST_FRAMEWORK_STARTUP_SERVICES_TIMEOUT", "120")
+        )
     )
 
     def __post_init__(self):
@@ -122,7 +157,7 @@ class MassaClusterConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LaunchInfo:
     """
     Represents information about a launched service and its associated pods.
@@ -137,8 +172,31 @@ class LaunchInfo:
 
 
 class MassaClusterManager:
-    def __init__(self, kube_config_path: Optional[str] = None):
-        self.manager = KubernetesManager(kube_config_path)
+    def __init__(self, kube_config_path: Optional[str] = None, **kwargs):
+        """
+        Initialize a MassaClusterManager object.
+
+        Args:
+            kube_config_path (str, optional): Path to a Kubernetes configuration file.
+            If None, in-cluster config is used.
+            kwargs: other KubernetesManager arguments (e.g. pool_maxsize, to keep more
+            connections alive when launching big clusters)
+        """
+        # Note: a single KubernetesManager (so a single api client and connection pool) is used
+        #       for the whole life of the cluster manager
+        self.manager = KubernetesManager(kube_config_path, **kwargs)
+
+    def close(self):
+        """
+        Release the connections to the api server.
+        """
+        self.manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     # Function to launch a Massa cluster
     def launch(self, cluster_config: MassaClusterConfig) -> list[LaunchInfo]:
@@ -146,6 +204,10 @@ class MassaClusterManager:
         prefix = "m"
         suffix = "p"
         docker_image = "aoudiamoncef/ubuntu-sshd"
+        # Note: set on every pod / service of the cluster so that they can be listed (or
+        #       removed) with a single label selector
+        cluster_labels = {CLUSTER_LABEL: cluster_config.namespace}
+        cluster_selector = f"{CLUSTER_LABEL}={cluster_config.namespace}"
 
         self.manager.create_namespace(cluster_config.namespace)
 
@@ -163,12 +225,15 @@ class MassaClusterManager:
             cluster_config.ssh_existing_secret, env_variables
         )
 
-        # Create and start all pods
+        # Create and start all pods (concurrently)
+        # Note: ports and env variables are the same for every pod, build them once (pods then
+        #       share the same kubernetes objects, see PodConfig.v1_container_ports)
+        pod_ports_config = tuple(
+            self.manager.create_pod_port_configs(opened_ports, prefix, suffix)
+        )
+        secret_env_variables = tuple(secret_env_variables)
         pod_configs = []
         for node_index in range(1, cluster_config.nodes_number + 1):
-            pod_ports_config = self.manager.create_pod_port_configs(
-                opened_ports, prefix, suffix
-            )
             pod_config = PodConfig(
                 cluster_config.namespace,
                 f"massa-node-{node_index}-container",
@@ -176,18 +241,27 @@ class MassaClusterManager:
                 f"massa-node-{node_index}-pod",
                 pod_ports_config,
                 secret_env_variables,
+                labels=cluster_labels,
             )
-            self.manager.create_pod(pod_config)
             pod_configs.append(pod_config)
+        logger.debug(
+            "Creating %d pods in namespace %s",
+            len(pod_configs),
+            cluster_config.namespace,
+        )
+        self.manager.create_pods(pod_configs)
 
-        # Wait for pods to start
-        time.sleep(cluster_config.startup_pods_timeout)
+        # Wait for pods to start (returns as soon as they are all running)
+        self.manager.wait_for_pods_running(
+            cluster_config.namespace,
+            [pod_config.name for pod_config in pod_configs],
+            cluster_config.startup_pods_timeout,
+        )
 
-        # Create all services after pods have started
+        # Create all services (concurrently) after pods have started
+        service_configs = []
         for node_index, pod_config in enumerate(pod_configs, start=1):
-            service_ports_config = (
-                service_ports_config
-            ) = self.manager.create_service_port_configs(
+            service_ports_config = self.manager.create_service_port_configs(
                 opened_ports, node_index, prefix, suffix
             )
 
@@ -197,47 +271,85 @@ class MassaClusterManager:
                 f"massa-node-{node_index}-service",
                 cluster_config.external_i_ps,
                 service_ports_config,
+                labels=cluster_labels,
             )
-            self.manager.create_service(service_config)
+            service_configs.append(service_config)
+        self.manager.create_services(service_configs)
 
         # Wait for services to start
-        time.sleep(cluster_config.startup_services_timeout)
-
-        # Assuming you have already imported the LaunchInfo class
+        self.manager.wait_for_services_ready(
+            cluster_config.namespace,
+            [service_config.name for service_config in service_configs],
+            cluster_config.startup_services_timeout,
+        )
 
         # Get pod and service information
-        pods_infos = sorted(
-            self.manager.get_pods_info(cluster_config.namespace), key=lambda p: p.name
-        )
-        services_infos = sorted(
-            self.manager.get_services_info(cluster_config.namespace),
-            key=lambda s: s.name,
+        # Note: both lists are fetched concurrently, with consistent reads (fresh): the api
+        #       server watch cache (or the manager cache) could miss the pods & services just
+        #       created, or return them without their ip
+        pods_list, services_list = self.manager.get_pods_and_services_info(
+            cluster_config.namespace, fresh=True, label_selector=cluster_selector
         )
+        pods_infos = {pod_info.name: pod_info for pod_info in pods_list}
+        services_infos = {
+            service_info.name: service_info for service_info in services_list
+        }
+
+        missing_pods = [
+            pod_config.name
+            for pod_config in pod_configs
+            if pod_config.name not in pods_infos
+        ]
+        missing_services = [
+            service_config.name
+            for service_config in service_configs
+            if service_config.name not in services_infos
+        ]
+        if missing_pods or missing_services:
+            raise RuntimeError(
+                f"Pods {missing_pods} and services {missing_services} not found in namespace "
+                f"{cluster_config.namespace} after launch"
+            )
 
         # Create LaunchInfo objects for each pair of pod and service information
+        # Note: paired by name, in node index order (sorting names would put node 10 before 2)
         launch_infos = [
-            LaunchInfo(pod_info, service_info)
-            for pod_info, service_info in zip(pods_infos, services_infos)
+            LaunchInfo(pods_infos[pod_config.name], services_infos[service_config.name])
+            for pod_config, service_config in zip(pod_configs, service_configs)
         ]
 
         return launch_infos
 
+    # Function to remove the nodes of a Massa cluster, keeping its namespace
+    def remove_nodes(self, namespace: str):
+        """
+        Remove the pods and services of a Massa cluster (the ones labelled by launch), keeping
+        the namespace and its secret so that the cluster can be launched again.
+
+        Args:
+            namespace (str): The namespace of the cluster.
+        """
+        self.manager.remove_pods_and_services(
+            namespace, label_selector=f"{CLUSTER_LABEL}={namespace}"
+        )
+
     # Function to terminate a Massa cluster
     def terminate(
         self, namespace: str, terminating_timeout: int = 60, waiting_interval: int = 5
     ):
+        """
+        Remove the namespace of a Massa cluster and wait (up to terminating_timeout seconds)
+        for its deletion.
+
+        Args:
+            namespace (str): The namespace of the cluster.
+            terminating_timeout (int): Maximum time to wait for (in seconds).
+            waiting_interval (int): Unused, the deletion is followed with a watch
+            (kept for compatibility).
+        """
         self.manager.remove_namespace(namespace)
-        start_time = time.time()
-
-        while True:
-            namespace_status = self.manager.get_namespace_status(
-                namespace
-            )  # Pass the namespace as an argument here
-
-            if namespace_status is None or namespace_status.phase != "Terminating":
-                break
-
-            if time.time() - start_time >= terminating_timeout:
-                break
-
-            time.sleep(waiting_interval)
+        try:
+            self.manager.wait_for_namespace_deleted(namespace, terminating_timeout)
+        except RuntimeError:
+            # Note: as before, a namespace still terminating after the timeout is not an error
+            logger.warning("Namespace %s is still terminating", namespace)
@@ -0,0 +1,223 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from typing import Optional
+from unittest import mock
+
+from kubernetes import client
+
+from .kubernetes_manager import AsyncKubernetesManager, KubernetesManager
+
+# Note: no api server is needed, the port is not listened to
+KUBE_CONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- cluster: {server: "https://127.0.0.1:1", insecure-skip-tls-verify: true}
+  name: test
+contexts:
+- context: {cluster: test, user: test}
+  name: test
+current-context: test
+users:
+- name: test
+  user: {token: test}
+"""
+
+
+class TestKubernetesManagerCache(unittest.TestCase):
+    def setUp(self):
+        fd, self.config_file = tempfile.mkstemp(suffix=".yml")
+        with os.fdopen(fd, "w") as fp:
+            fp.write(KUBE_CONFIG)
+        self.manager = KubernetesManager(self.config_file, cache_ttl=10)
+        self.fetch = mock.Mock(side_effect=lambda namespace, *args: [namespace, *args])
+
+    def tearDown(self):
+        self.manager.close()
+        os.unlink(self.config_file)
+
+    def test_cached(self):
+        res = self.manager._cached("pods", "ns1", False, self.fetch, "sel")
+        assert res == ["ns1", "sel"]
+        # returned lists are copies
+        res.append("foo")
+        assert self.manager._cached("pods", "ns1", False, self.fetch, "sel") == [
+            "ns1",
+            "sel",
+        ]
+        assert self.fetch.call_count == 1
+
+        # fresh or other args: fetched again
+        self.manager._cached("pods", "ns1", True, self.fetch, "sel")
+        self.manager._cached("pods", "ns1", False, self.fetch, "other")
+        assert self.fetch.call_count == 3
+
+    def test_cached_ttl(self):
+        with mock.patch("time.monotonic", return_value=100.0):
+            self.manager._cached("pods", "ns1", False, self.fetch)
+            self.manager._cached("services", "ns1", False, self.fetch)
+        with mock.patch("time.monotonic", return_value=109.0):
+            self.manager._cached("pods", "ns1", False, self.fetch)
+        assert self.fetch.call_count == 2
+        with mock.patch("time.monotonic", return_value=110.0):
+            self.manager._cached("pods", "ns1", False, self.fetch)
+        assert self.fetch.call_count == 3
+        # expired entries are dropped
+        assert list(self.manager._cache) == [("pods", "ns1")]
+
+    def test_cache_disabled(self):
+        self.manager.cache_ttl = 0
+        self.manager._cached("pods", "ns1", False, self.fetch)
+        self.manager._cached("pods", "ns1", False, self.fetch)
+        assert self.fetch.call_count == 2
+        assert not self.manager._cache
+
+    def test_invalidate_cache(self):
+        for namespace in ("ns1", "ns2"):
+            self.manager._cached("pods", namespace, False, self.fetch)
+            self.manager._cached("namespace", namespace, False, self.fetch)
+
+        self.manager.invalidate_cache("ns1")
+        assert sorted(self.manager._cache) == [("namespace", "ns2"), ("pods", "ns2")]
+        self.manager.invalidate_cache()
+        assert not self.manager._cache
+
+    def test_cache_threads(self):
+        errors = []
+
+        def worker(index: int):
+            try:
+                for i in range(500):
+                    self.manager._cached("pods", f"ns{index}", False, self.fetch, i)
+                    self.manager.invalidate_cache(f"ns{(index + 1) % 4}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+
+
+class TestKubernetesManagerReadyEvents(unittest.TestCase):
+    def setUp(self):
+        fd, self.config_file = tempfile.mkstemp(suffix=".yml")
+        with os.fdopen(fd, "w") as fp:
+            fp.write(KUBE_CONFIG)
+        self.manager = KubernetesManager(self.config_file)
+        # Note: pod events are sent by the tests instead of an informer
+        patcher = mock.patch.object(self.manager, "start_informer")
+        self.start_informer = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.manager.close()
+        os.unlink(self.config_file)
+
+    @staticmethod
+    def pod(phase: Optional[str]):
+        return client.V1Pod(
+            metadata=client.V1ObjectMeta(name="pod", namespace="ns"),
+            status=client.V1PodStatus(phase=phase) if phase else None,
+        )
+
+    def test_on_pod_event(self):
+        # ADDED event without status
+        self.manager._on_pod_event("ADDED", self.pod(None))
+        assert not self.manager._ready_events[("ns", "pod")].is_set()
+        self.manager._on_pod_event("MODIFIED", self.pod("Running"))
+        assert self.manager.wait_until_ready("ns", "pod", 0)
+        # entries are dropped with their pod
+        self.manager._on_pod_event("DELETED", self.pod("Running"))
+        assert not self.manager._ready_events
+
+    def test_pod_to_info_without_status(self):
+        pod = self.pod(None)
+        pod.spec = client.V1PodSpec(containers=[])
+        pod_info = self.manager._pod_to_info(pod, "ns")
+        assert (pod_info.name, pod_info.status, pod_info.pod_ip) == ("pod", None, None)
+
+    def test_wait_until_ready_timeout(self):
+        assert not self.manager.wait_until_ready("ns", "pod", 0.1)
+        assert not self.manager._ready_events
+
+    def test_wait_until_ready_stops_informer(self):
+        informer = mock.Mock()
+
+        def start_informer(namespace, pods=True, services=True):
+            self.manager._informers[("pods", namespace)] = informer
+            self.manager._on_pod_event("MODIFIED", self.pod("Running"))
+
+        self.start_informer.side_effect = start_informer
+        assert self.manager.wait_until_ready("ns", "pod", 0.1)
+        # started for the wait only
+        informer.stop.assert_called_once()
+        assert not self.manager._informers
+        assert not self.manager._ready_events
+
+        # an informer already running is kept
+        self.manager._informers[("pods", "ns")] = informer
+        self.manager._on_pod_event("MODIFIED", self.pod("Running"))
+        assert self.manager.wait_until_ready("ns", "pod", 0.1)
+        assert self.manager._informers == {("pods", "ns"): informer}
+        informer.stop.assert_called_once()
+
+
+class TestServicePortsInfo(unittest.TestCase):
+    def test_iter_services_ports_info(self):
+        fd, config_file = tempfile.mkstemp(suffix=".yml")
+        with os.fdopen(fd, "w") as fp:
+            fp.write(KUBE_CONFIG)
+        self.addCleanup(os.unlink, config_file)
+        manager = KubernetesManager(config_file)
+        self.addCleanup(manager.close)
+
+        service = {
+            "metadata": {"name": "service", "namespace": "ns"},
+            "spec": {
+                "ports": [
+                    {"name": "m-22-p", "port": 22, "targetPort": 22, "nodePort": 30022},
+                    {"name": "m-33035-p", "port": 33035, "targetPort": "m-33035-p"},
+                ]
+            },
+        }
+        with mock.patch.object(manager, "_iter_pages", return_value=[service]):
+            ((name, ports_info),) = manager.iter_services_ports_info("ns")
+
+        assert name == "service"
+        assert ports_info.names == ("m-22-p", "m-33035-p")
+        assert list(ports_info.ports) == [22, 33035]
+        assert ports_info.target_ports == (22, "m-33035-p")
+        assert list(ports_info.node_ports) == [30022, 0]
+        # Note: arrays are mutable, so is ServicePortsInfo
+        with self.assertRaises(TypeError):
+            hash(ports_info)
+
+
+class TestAsyncKubernetesManager(unittest.TestCase):
+    def test_async_context_manager_closes(self):
+        fd, config_file = tempfile.mkstemp(suffix=".yml")
+        with os.fdopen(fd, "w") as fp:
+            fp.write(KUBE_CONFIG)
+        self.addCleanup(os.unlink, config_file)
+
+        manager = AsyncKubernetesManager(config_file)
+        close = mock.patch.object(
+            manager.manager, "close", wraps=manager.manager.close
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+        async def run():
+            async with manager as entered:
+                assert entered is manager
+            close.assert_called_once()
+            # Note: close can be called several times
+            await manager.close()
+
+        asyncio.run(run())
+        assert close.call_count == 2
@@ -1,4 +1,5 @@
 import sys
+import subprocess
 from pathlib import Path
 from contextlib import contextmanager
 
@@ -30,23 +31,30 @@ class LedgerEditor:
         self.install_folder = self._install()
 
     def _install(self) -> Path | RemotePath:
+        # Note: mkdtemp already creates the folder
         tmp_folder = self.server.mkdtemp(prefix="massa_ledger_editor_")
-        # print(f"Creating folder: {tmp_folder}")
-        self.server.mkdir(tmp_folder)
         repo = self.compile_unit.repo
 
         for to_create in self._to_create:
             f = Path(tmp_folder) / to_create
             self.server.mkdir(Path(f))
 
+        to_copy = []
         for filename, to_install in self._to_install.items():
             src = repo / to_install
             if filename == "massa-ledger-editor":
                 dst = tmp_folder / filename
             else:
                 dst = tmp_folder / to_install
-            # print(f"Creating folder: {dst.parent}")
-            self.server.mkdir(dst.parent)
+            to_copy.append((src, dst))
+
+        # Note: config files share a few folders, create each of them once (a remote request
+        #       each), parents first (sorted paths)
+        for folder in sorted({dst.parent for _, dst in to_copy}, key=str):
+            # print(f"Creating folder: {folder}")
+            self.server.mkdir(folder)
+
+        for src, dst in to_copy:
             # print(f"Copying {src} ({type(src)}) to {dst} ({type(dst)})...")
             copy_file(src, dst)
 
@@ -74,7 +82,7 @@ class LedgerEditor:
         self,
         env: Optional[Dict[str, str]] = None,
         args: Optional[List[str]] = None,
-        stdout=sys.stdout,
+        stdout=None,
         stderr=sys.stderr,
     ):
         """Run Massa ledger editor
@@ -84,7 +92,7 @@ class LedgerEditor:
         Args:
             env:
             args: additional node arguments (e.g. ["--restart-from-snapshot-at-period", "10"])
-            stdout: where to log node standard output (default to sys.stdout)
+            stdout: where to log node standard output (default to None: output is discarded)
             stderr: where to log node standard error output (default to sys.stderr)
         """
 
@@ -96,6 +104,10 @@ class LedgerEditor:
                 cmd += args_joined
 
         print(f"{cmd=}")
+        # Note: output not requested by the caller is sent to /dev/null (and not relayed
+        #       through python)
+        if stdout is None:
+            stdout = subprocess.DEVNULL
         process = self.server.run(
             [cmd],
             cwd=str(self.install_folder),
@@ -1,9 +1,11 @@
 import json
+import threading
 from functools import partial
 from typing import List, Any
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 @dataclass
@@ -135,15 +137,101 @@ class Api2:
     def __init__(self, url) -> None:
         self.url = url
         self._api = JsonApi()
+        # Note: a session keeps the connections to the node alive between requests.
+        #       requests.Session is not guaranteed to be thread safe and Api2 objects are
+        #       shared between threads (e.g. by Node), so each thread gets its own session
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount(self.url, HTTPAdapter(pool_connections=1, pool_maxsize=32))
+            session.headers["Content-type"] = "application/json"
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close the connections to the node
+
+        Api2 can still be used after (new connections are opened)
+        """
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "Api2":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _make_request(self, *args) -> Any:
         f = getattr(self._api, args[0])
-        headers, payload = f(*args[1:])
-        # print(f"{headers=}")
+        # Note: Content-type header is set by the session
+        _headers, payload = f(*args[1:])
         # print(f"{payload=}")
-        response = requests.post(self.url, headers=headers, data=payload)
+        response = self._session.post(self.url, data=payload)
         return response.json()
 
+    def batch(self, *items: tuple) -> list[Any]:
+        """Send several json rpc requests in a single http request
+
+        Args:
+            items: requests as tuples: (method name, *args), e.g. ("get_addresses", [addr])
+
+        Returns:
+            A list of json rpc responses (same order as items)
+
+        Raise:
+            RuntimeError if the node does not answer with exactly one response per request
+            (e.g. an error response to the whole batch)
+        """
+
+        if not items:
+            return []
+
+        payload = []
+        for id_, (method, *args) in enumerate(items):
+            _headers, request = getattr(self._api, method)(*args)
+            # Note: every request of a batch needs its own id
+            payload.append({**json.loads(request), "id": id_})
+
+        response = self._session.post(self.url, data=json.dumps(payload))
+        responses = response.json()
+        if not isinstance(responses, list):
+            raise RuntimeError(f"Invalid response to json rpc batch: {responses}")
+
+        # Note: responses of a batch can be returned in any order, use the id to match them
+        results: list[Any] = [None] * len(items)
+        for r in responses:
+            response_id = r.get("id") if isinstance(r, dict) else None
+            if (
+                type(response_id) is not int
+                or not 0 <= response_id < len(items)
+                or results[response_id] is not None
+            ):
+                raise RuntimeError(f"Invalid response to json rpc batch: {r}")
+            results[response_id] = r
+
+        missing = [
+            f"{index} ({items[index][0]})"
+            for index, result in enumerate(results)
+            if result is None
+        ]
+        if missing:
+            raise RuntimeError(
+                f"No response to json rpc batch requests: {', '.join(missing)}"
+            )
+        return results
+
     def __getattr__(self, item):
         if hasattr(self._api, item):
             return partial(self._make_request, item)
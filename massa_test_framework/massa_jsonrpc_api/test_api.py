@@ -0,0 +1,106 @@
+import json
+import threading
+import unittest
+from unittest import mock
+
+from .api import Api2, JsonApi
+
+
+class TestApi2(unittest.TestCase):
+    def setUp(self):
+        self.api = Api2("http://127.0.0.1:33035")
+        self.sent: list = []
+        self.responses = None
+
+        def post(url, data):
+            self.sent.append(json.loads(data))
+            response = mock.Mock()
+            response.json.return_value = self.responses
+            return response
+
+        patcher = mock.patch.object(self.api._session, "post", side_effect=post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_json_api(self):
+        # (headers, serialized payload)
+        headers, payload = JsonApi.get_addresses(["AU12"])
+        assert headers == {"Content-type": "application/json"}
+        assert json.loads(payload) == {
+            "jsonrpc": "2.0",
+            "method": "get_addresses",
+            "id": 0,
+            "params": [["AU12"]],
+        }
+
+    def test_single_call(self):
+        self.responses = {"jsonrpc": "2.0", "id": 0, "result": {}}
+        assert self.api.get_status() == self.responses
+        assert self.sent[0]["method"] == "get_status"
+
+    def test_batch(self):
+        # responses in any order
+        self.responses = [
+            {"jsonrpc": "2.0", "id": 2, "result": "c"},
+            {"jsonrpc": "2.0", "id": 0, "result": "a"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32602}},
+        ]
+        results = self.api.batch(
+            ("get_status",), ("get_addresses", ["AU12"]), ("get_stakers",)
+        )
+        assert [r["id"] for r in results] == [0, 1, 2]
+        assert [r["method"] for r in self.sent[0]] == [
+            "get_status",
+            "get_addresses",
+            "get_stakers",
+        ]
+        assert [r["id"] for r in self.sent[0]] == [0, 1, 2]
+        assert self.sent[0][1]["params"] == [["AU12"]]
+
+    def test_batch_empty(self):
+        assert self.api.batch() == []
+        assert not self.sent
+
+    def test_batch_invalid_responses(self):
+        items = [("get_status",), ("get_stakers",)]
+        invalid_responses = [
+            # error for the whole batch
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}},
+            [{"jsonrpc": "2.0", "id": None, "error": {"code": -32700}}],
+            [{"jsonrpc": "2.0", "result": "a"}],
+            [{"jsonrpc": "2.0", "id": 2, "result": "a"}],
+            [{"jsonrpc": "2.0", "id": "0", "result": "a"}],
+            [{"jsonrpc": "2.0", "id": 0}, {"jsonrpc": "2.0", "id": 0}],
+        ]
+        for responses in invalid_responses:
+            self.responses = responses
+            with self.assertRaises(RuntimeError):
+                self.api.batch(*items)
+
+    def test_batch_missing_responses(self):
+        self.responses = [{"jsonrpc": "2.0", "id": 1, "result": "b"}]
+        with self.assertRaisesRegex(RuntimeError, r"0 \(get_status\)"):
+            self.api.batch(("get_status",), ("get_stakers",))
+
+
+class TestApi2Sessions(unittest.TestCase):
+    def test_session_per_thread(self):
+        api = Api2("http://127.0.0.1:33035")
+        session = api._session
+        assert api._session is session
+        assert session.headers["Content-type"] == "application/json"
+
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(api._session))
+        thread.start()
+        thread.join()
+        assert sessions[0] is not session
+
+    def test_close(self):
+        with Api2("http://127.0.0.1:33035") as api:
+            session = api._session
+            with mock.patch.object(session, "close") as close:
+                api.close()
+                close.assert_called_once()
+            # a new session is created on next use
+            assert api._session is not session
@@ -248,6 +248,9 @@ class Node:
         except (ConnectionRefusedError, requests.exceptions.ConnectionError):
             # node is stuck or already stopped - try to terminate the process
             self.server.stop(process)
+        # Note: the connections kept alive to the node are now useless
+        self.pub_api2.close()
+        self.priv_api2.close()
         # else:
         #     # Note: sometimes the node take ages to end so we force the stop here too
         #     #       happens for subprocess.Popen
@@ -6,6 +6,7 @@ import time
 import sys
 from pathlib import Path
 import datetime
+import shlex
 import shutil
 import subprocess
 import tempfile
@@ -109,7 +110,9 @@ class ParamikoRemotePopen:
                         # fp.write(channel.recv(65535))
                         # print(channel.recv(65535))
                         buf = channel.recv(65535)
-                        if isinstance(fp, io.TextIOBase):
+                        if fp == subprocess.DEVNULL:
+                            pass
+                        elif isinstance(fp, io.TextIOBase):
                             fp.write(buf.decode())
                         else:
                             fp.write(buf)
@@ -124,7 +127,10 @@ class ParamikoRemotePopen:
                 if channel.recv_ready():
                     # fp.write(channel.recv(65535))
                     buf = channel.recv(65535)
-                    if isinstance(fp, io.TextIOBase):
+                    # Note: channel still need to be read (remote process could block otherwise)
+                    if fp == subprocess.DEVNULL:
+                        pass
+                    elif isinstance(fp, io.TextIOBase):
                         fp.write(buf.decode())
                     else:
                         fp.write(buf)
@@ -193,6 +199,9 @@ class SshServer:
     def remove(self, path: str) -> None:
         return self.ftp_client.remove(path)
 
+    def rename(self, src: str, dst: str) -> None:
+        return self.ftp_client.rename(src, dst)
+
     def run(
         self,
         cmd: List[str],
@@ -282,6 +291,26 @@ class Server:
         else:
             self.server.remove(str(path))
 
+    def rename(self, src: Path | str, dst: Path | str) -> None:
+        """Rename a file or folder
+
+        Raise:
+            OSError: if dst already exists (and is not an empty folder)
+        """
+        if self.server_opts.local:
+            os.rename(src, dst)
+        else:
+            self.server.rename(str(src), str(dst))
+
+    def fast_rmtree(self, path: Path | str) -> None:
+        """Remove a folder recursively (does nothing if it does not exist)"""
+        if self.server_opts.local:
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            # Note: a single rm -rf instead of removing every entry using sftp
+            with self.run([f"rm -rf -- {shlex.quote(str(path))}"]) as proc:
+                proc.wait()
+
     def stop(self, process):
         if self.server_opts.local:
             process.terminate()
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+from .compile import (
+    DEFAULT_CONSTANT_FILE,
+    CompileOpts,
+    CompileUnit,
+    PatchConstant,
+    _group_patches,
+)
+
+
+class TestPatchConstant(unittest.TestCase):
+    def test_apply_to_text(self):
+        content = (
+            "pub const THREAD_COUNT: u8 = 32;\n"
+            "pub const PERIODS_PER_CYCLE: u64 = 128;\n"
+        )
+        patch = PatchConstant("THREAD_COUNT", "2", None, None)
+        assert patch.apply_to_text(content) == (
+            "pub const THREAD_COUNT: u8 = 2;\n"
+            "pub const PERIODS_PER_CYCLE: u64 = 128;\n"
+        )
+
+    def test_group_patches_keep_order(self):
+        other_file = Path("massa-node/src/settings.rs")
+        c1 = PatchConstant("A", "1", None, DEFAULT_CONSTANT_FILE)
+        c2 = PatchConstant("B", "2", None, other_file)
+        c3 = PatchConstant("C", "3", None, DEFAULT_CONSTANT_FILE)
+        c4 = PatchConstant("D", "4", None, None)
+        patches: dict[str, bytes | str | Path | PatchConstant] = {
+            "c1": c1,
+            "c2": c2,
+            "c3": c3,
+            "diff": b"--- a/foo\n+++ b/foo\n",
+            "c4": c4,
+        }
+
+        groups = _group_patches(patches)
+        # consecutive constants are grouped per file, diff patches stay in between
+        assert groups == [
+            {DEFAULT_CONSTANT_FILE: [c1, c3], other_file: [c2]},
+            (3, "diff", b"--- a/foo\n+++ b/foo\n"),
+            {DEFAULT_CONSTANT_FILE: [c4]},
+        ]
+
+    def test_apply_patch_constants(self):
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            constant_path = Path(tmp_folder) / DEFAULT_CONSTANT_FILE
+            constant_path.parent.mkdir(parents=True)
+            constant_path.write_text(
+                "pub const A: u8 = 0;\npub const B: u64 = 0;\npub const AB: u64 = 0;\n"
+            )
+            CompileUnit._apply_patch_constants(
+                Path(tmp_folder),
+                {
+                    DEFAULT_CONSTANT_FILE: [
+                        PatchConstant("A", "1", None, None),
+                        PatchConstant("B", "2", None, None),
+                        PatchConstant("A", "3", None, None),
+                    ]
+                },
+            )
+            # patches are applied in order (last one wins) and only exact names are updated
+            assert constant_path.read_text() == (
+                "pub const A: u8 = 3;\npub const B: u64 = 2;\npub const AB: u64 = 0;\n"
+            )
+
+
+class TestCacheKey(unittest.TestCase):
+    @staticmethod
+    def cache_key(**kwargs) -> str | None:
+        cu = CompileUnit(mock.Mock(), CompileOpts(**kwargs))
+        with mock.patch.object(cu, "_run_output", return_value=(0, "abcd\tHEAD\n")):
+            return cu._cache_key("cargo build")
+
+    def test_cache_key(self):
+        key = self.cache_key()
+        assert key is not None
+        assert self.cache_key() == key
+        # every option changing the build output gives another key
+        assert self.cache_key(clone_opts=["--recurse-submodules"]) != key
+        assert self.cache_key(shallow_clone=False) != key
+        assert self.cache_key(patch_backend="patch_ng") != key
+        # but not the ones only changing how the build is done
+        assert self.cache_key(parallel_prefetch=False) == key
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import massa_test_framework
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_import_is_lazy(self):
+        # Note: run in a new interpreter (modules may already be imported here)
+        code = (
+            "import sys\n"
+            "import massa_test_framework\n"
+            "assert 'massa_test_framework.server' not in sys.modules\n"
+            "assert 'paramiko' not in sys.modules\n"
+            "server_cls = massa_test_framework.Server\n"
+            "assert 'massa_test_framework.server' in sys.modules\n"
+            "assert vars(massa_test_framework)['Server'] is server_cls\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_exports(self):
+        # Note: not resolved here, some modules need optional dependencies (e.g. node.py)
+        assert set(massa_test_framework.__all__) <= set(dir(massa_test_framework))
+        assert massa_test_framework.LedgerEditor.__name__ == "LedgerEditor"
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(massa_test_framework, "DoesNotExist")
+
+    def test_preload(self):
+        code = (
+            "import sys, time\n"
+            "import massa_test_framework\n"
+            "deadline = time.monotonic() + {wait}\n"
+            "while 'paramiko' not in sys.modules and time.monotonic() < deadline:\n"
+            "    time.sleep(0.05)\n"
+            "assert ('paramiko' in sys.modules) == {preload}\n"
+        )
+        # opt-in
+        subprocess.run(
+            [sys.executable, "-c", code.format(wait=0.5, preload=False)], check=True
+        )
+        env = {**os.environ, "MASSA_TF_PRELOAD": "1"}
+        subprocess.run(
+            [sys.executable, "-c", code.format(wait=10, preload=True)],
+            env=env,
+            check=True,
+        )